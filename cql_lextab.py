@@ -0,0 +1,10 @@
+# cql_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'AS', 'AVG', 'CALL', 'COMMA', 'COMMENT', 'COUNT', 'CREATE', 'DISCARD', 'DISTINCT', 'DO', 'END', 'EQUALS', 'EXPORT', 'FROM', 'GT', 'GTE', 'ID', 'IMPORT', 'JOIN', 'LIMIT', 'LPAREN', 'LT', 'LTE', 'MULTILINE_COMMENT', 'NOTEQUALS', 'NUMBER', 'PRINT', 'PROCEDURE', 'RENAME', 'RPAREN', 'SELECT', 'SEMICOLON', 'SET', 'STAR', 'STRING', 'TABLE', 'UPDATE', 'USING', 'WHERE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_LTE><=)|(?P<t_GTE>>=)|(?P<t_NOTEQUALS><>)|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_NUMBER>-?\\d*\\.?\\d+)|(?P<t_STRING>\\"[^\\"]*\\")|(?P<t_COMMENT>--.*)|(?P<t_MULTILINE_COMMENT>\\{-.*?-\\})|(?P<t_newline>\\n+)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_STAR>\\*)|(?P<t_EQUALS>=)|(?P<t_LT><)|(?P<t_GT>>)|(?P<t_COMMA>,)|(?P<t_SEMICOLON>;)', [None, ('t_LTE', 'LTE'), ('t_GTE', 'GTE'), ('t_NOTEQUALS', 'NOTEQUALS'), ('t_ID', 'ID'), ('t_NUMBER', 'NUMBER'), ('t_STRING', 'STRING'), ('t_COMMENT', 'COMMENT'), ('t_MULTILINE_COMMENT', 'MULTILINE_COMMENT'), ('t_newline', 'newline'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'STAR'), (None, 'EQUALS'), (None, 'LT'), (None, 'GT'), (None, 'COMMA'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
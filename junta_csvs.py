@@ -1,5 +1,5 @@
 # Script para juntar os CSVs exportados em um único arquivo
-import csv
+import shutil
 
 arquivos = [
     'temps_altas.csv',
@@ -7,12 +7,16 @@ arquivos = [
     'temperaturas_altas.csv'
 ]
 
+# Tamanho do bloco usado na cópia (1 MiB)
+TAMANHO_BLOCO = 1 << 20
+
 with open('dados_completos_multi.csv', 'w', encoding='utf-8', newline='') as fout:
     for idx, arquivo in enumerate(arquivos):
+        # Em modo texto as quebras de linha (ex.: CRLF) são convertidas para '\n'
         with open(arquivo, 'r', encoding='utf-8') as fin:
             if idx > 0:
                 fout.write('\n')  # separador entre tabelas
             fout.write(f'==== {arquivo} ====' + '\n')
-            for line in fin:
-                fout.write(line)
+            # Copia o conteúdo em blocos, sem passar linha a linha pelo Python
+            shutil.copyfileobj(fin, fout, TAMANHO_BLOCO)
 print('Arquivo dados_completos_multi.csv gerado com sucesso.')
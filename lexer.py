@@ -1,14 +1,20 @@
+import sys
 import ply.lex as lex
 
+# Reserved words: matched by t_ID and retyped through a dictionary lookup
+reserved = {
+    'IMPORT': 'IMPORT', 'EXPORT': 'EXPORT', 'TABLE': 'TABLE', 'FROM': 'FROM',
+    'AS': 'AS', 'DISCARD': 'DISCARD', 'RENAME': 'RENAME', 'PRINT': 'PRINT',
+    'SELECT': 'SELECT', 'WHERE': 'WHERE', 'CREATE': 'CREATE', 'JOIN': 'JOIN',
+    'USING': 'USING', 'PROCEDURE': 'PROCEDURE', 'DO': 'DO', 'END': 'END',
+    'CALL': 'CALL', 'LIMIT': 'LIMIT', 'UPDATE': 'UPDATE', 'SET': 'SET',
+    'AVG': 'AVG', 'AND': 'AND', 'COUNT': 'COUNT', 'DISTINCT': 'DISTINCT',
+}
+
 # List of token names
-tokens = (
-    # Keywords
-    'IMPORT', 'EXPORT', 'TABLE', 'FROM', 'AS', 'DISCARD', 'RENAME',
-    'PRINT', 'SELECT', 'WHERE', 'CREATE', 'JOIN', 'USING', 'PROCEDURE',
-    'DO', 'END', 'CALL', 'LIMIT', 'UPDATE', 'SET', 'AVG',
-    
+tokens = tuple(reserved.values()) + (
     # Operators
-    'EQUALS', 'NOTEQUALS', 'LT', 'GT', 'LTE', 'GTE', 'AND',
+    'EQUALS', 'NOTEQUALS', 'LT', 'GT', 'LTE', 'GTE',
     
     # Literals
     'ID', 'NUMBER', 'STRING',
@@ -20,109 +26,38 @@ tokens = (
     'COMMENT', 'MULTILINE_COMMENT'
 )
 
+# Multi-character operators are function rules so they are tried, in
+# declaration order, before the single-character '<' and '>' rules
+def t_LTE(t):
+    r'<='
+    return t
+
+def t_GTE(t):
+    r'>='
+    return t
+
+def t_NOTEQUALS(t):
+    r'<>'
+    return t
+
 # Regular expression rules for simple tokens
 t_EQUALS = r'='
-t_NOTEQUALS = r'<>'
 t_LT = r'<'
 t_GT = r'>'
-t_LTE = r'<='
-t_GTE = r'>='
-t_AND = r'AND'
 t_COMMA = r','
 t_SEMICOLON = r';'
 t_LPAREN = r'\('
 t_RPAREN = r'\)'
 t_STAR = r'\*'
 
-# Keywords
-def t_IMPORT(t):
-    r'IMPORT'
-    return t
-
-def t_EXPORT(t):
-    r'EXPORT'
-    return t
-
-def t_TABLE(t):
-    r'TABLE'
-    return t
-
-def t_FROM(t):
-    r'FROM'
-    return t
-
-def t_AS(t):
-    r'AS'
-    return t
-
-def t_DISCARD(t):
-    r'DISCARD'
-    return t
-
-def t_RENAME(t):
-    r'RENAME'
-    return t
-
-def t_PRINT(t):
-    r'PRINT'
-    return t
-
-def t_SELECT(t):
-    r'SELECT'
-    return t
-
-def t_WHERE(t):
-    r'WHERE'
-    return t
-
-def t_CREATE(t):
-    r'CREATE'
-    return t
-
-def t_JOIN(t):
-    r'JOIN'
-    return t
-
-def t_USING(t):
-    r'USING'
-    return t
-
-def t_PROCEDURE(t):
-    r'PROCEDURE'
-    return t
-
-def t_DO(t):
-    r'DO'
-    return t
-
-def t_END(t):
-    r'END'
-    return t
-
-def t_CALL(t):
-    r'CALL'
-    return t
-
-def t_LIMIT(t):
-    r'LIMIT'
-    return t
-
-def t_UPDATE(t):
-    r'UPDATE'
-    return t
-
-def t_SET(t):
-    r'SET'
-    return t
-
-def t_AVG(t):
-    r'AVG'
-    return t
-
 # Regular expression rules for complex tokens
 def t_ID(t):
     r'[a-zA-Z_][a-zA-Z0-9_]*'
     # Identifiers: starts with letter or underscore, followed by letters, digits, or underscores
+    # Reserved words share this rule and only change the token type
+    t.type = reserved.get(t.value, 'ID')
+    # Identifiers (table and column names) are interned so dict lookups compare by identity
+    t.value = sys.intern(t.value)
     return t
 
 def t_NUMBER(t):
@@ -160,8 +95,8 @@ def t_error(t):
     print(f"Illegal character '{t.value[0]}' at line {t.lineno}, position {t.lexpos}")
     t.lexer.skip(1)
 
-# Build the lexer
-lexer = lex.lex()
+# Build the lexer (optimize=1 reuses the cached tables in cql_lextab.py)
+lexer = lex.lex(optimize=1, lextab="cql_lextab", debug=0)
 
 # Example test function (uncomment to use)
 """
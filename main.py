@@ -1,68 +1,180 @@
 import sys
+import re
 import csv
+import operator
+from functools import partial
+from itertools import chain, islice
 from lexer import lexer
-from parser import parser, tables, procedures
+from parser import parser, tables, procedures, Op, ParseError, Select, CreateFromSelect
 
-def evaluate_condition(row, condition):
-    """Avalia uma condição em uma linha de dados.
+# Tamanho do buffer dos arquivos CSV lidos e escritos (1 MiB)
+FILE_BUFFER_SIZE = 1 << 20
+
+# Número de linhas escritas de cada vez no stdout
+OUTPUT_CHUNK_LINES = 8192
+
+# Índices de hash para junções: (tabela, coluna, chaves normalizadas) -> (linhas indexadas, {valor: linha})
+table_indexes = {}
+
+# Procedimentos compilados: nome -> lista de funções que executam cada comando
+compiled_procedures = {}
+
+# Comandos do script em execução, tal como analisados pelo parser
+script_statements = []
+
+# Tabelas exportadas por CALL EXPORT_TODAS_TABELAS
+EXPORT_TODAS_TABELAS = ['temps_altas', 'dados_completos', 'temperaturas_altas']
+
+# Funções de comparação associadas a cada operador do parser
+OPERATOR_FUNCTIONS = {
+    Op.EQ: operator.eq,
+    Op.NE: operator.ne,
+    Op.LT: operator.lt,
+    Op.GT: operator.gt,
+    Op.LE: operator.le,
+    Op.GE: operator.ge,
+}
+
+# Ordem de avaliação das comparações num AND (as mais seletivas primeiro)
+OPERATOR_SELECTIVITY = {Op.EQ: 0, Op.NE: 1, Op.LT: 2, Op.GT: 3, Op.LE: 4, Op.GE: 5}
+
+# Números sem sinal com no máximo um ponto decimal (ex.: 20, 20.5, .5) e inteiros com sinal
+NUMERIC_TARGET_PATTERN = re.compile(r'\d+\.?\d*|\.\d+')
+INTEGER_PATTERN = re.compile(r'-?\d+')
+
+def flatten_and(condition):
+    """Devolve as condições simples combinadas por um AND.
+    
+    O parser já junta cadeias de AND num único nó ('AND', [condições]);
+    nós AND que apareçam dentro da lista também são achatados.
     
     Args:
-        row (dict): Linha de dados como um dicionário.
-        condition (tuple): Tupla com a condição do parser (ex.: ('=', 'coluna', valor)).
+        condition (tuple): Condição do parser.
     
     Returns:
-        bool: True se a condição for satisfeita, False caso contrário.
+        list: Condições que são combinadas por AND.
     """
-    # Se não houver condição, retorna True (sem filtro)
-    if condition is None:
-        return True
+    if isinstance(condition, tuple) and condition[0] == 'AND':
+        return [leaf for operand in condition[1] for leaf in flatten_and(operand)]
+    return [condition]
+
+def ordered_and_leaves(condition):
+    """Devolve as condições de um AND pela ordem de avaliação (as mais seletivas primeiro).
+    
+    Usada tanto pela avaliação por colunas como pelos predicados compilados,
+    para que ambas avaliem as comparações pela mesma ordem.
+    
+    Args:
+        condition (tuple): Nó AND do parser.
+    
+    Returns:
+        list: Condições simples ordenadas por OPERATOR_SELECTIVITY.
+    """
+    return sorted(flatten_and(condition), key=lambda leaf: OPERATOR_SELECTIVITY.get(leaf[0], len(OPERATOR_SELECTIVITY)))
+
+def combine_and(first, second):
+    """Combina dois predicados compilados com AND (com curto-circuito)."""
+    return lambda row: first(row) and second(row)
+
+def is_numeric_target(value):
+    """Verifica se o valor de uma comparação do WHERE deve ser tratado como número."""
+    return isinstance(value, (int, float)) or (isinstance(value, str) and NUMERIC_TARGET_PATTERN.fullmatch(value) is not None)
+
+def compile_where(condition):
+    """Compila uma cláusula ('WHERE', condição), compilando a subcondição."""
+    return compile_condition(condition[1])
+
+def compile_and(condition):
+    """Compila um AND: achata a cadeia e avalia primeiro as comparações mais
+    seletivas, aproveitando o curto-circuito do 'and'."""
+    leaves = ordered_and_leaves(condition)
+    predicates = [compile_condition(leaf) for leaf in leaves]
+    combined = predicates[-1]
+    for predicate in reversed(predicates[:-1]):
+        combined = combine_and(predicate, combined)
+    return combined
+
+def compile_comparison(condition):
+    """Compila uma comparação simples (ex.: (Op.EQ, 'coluna', valor)).
+    
+    As conversões do valor alvo para número são feitas aqui e não por linha.
+    """
+    op, column, target_value = condition
+    compare = OPERATOR_FUNCTIONS[op]
     
-    # Verifica se a condição é uma tupla (formato do parser)
-    if isinstance(condition, tuple):
-        # Trata cláusula WHERE, avaliando a subcondição
-        if condition[0] == 'WHERE':
-            return evaluate_condition(row, condition[1])
-        # Trata operador AND, combinando duas condições
-        if condition[0] == 'AND':
-            return evaluate_condition(row, condition[1]) and evaluate_condition(row, condition[2])
+    # Verifica se o valor alvo é numérico
+    if is_numeric_target(target_value):
+        numeric_target = float(target_value)
         
-        # Trata comparações simples (ex.: coluna = valor)
-        op, column, target_value = condition
-        row_value = row.get(column)
+        def predicate(row):
+            row_value = row.get(column)
+            # Se a coluna não existe na linha, retorna False
+            if row_value is None:
+                return False
+            # Colunas numéricas já foram convertidas na importação
+            if isinstance(row_value, (int, float)):
+                return compare(row_value, numeric_target)
+            # Tenta converter o valor da linha para float (mantém como string se falhar)
+            try:
+                row_value = float(row_value)
+            except (ValueError, TypeError):
+                # Texto não numérico (ex.: 'N/A') comparado com um número: os operadores
+                # de ordem não se aplicam e a linha não satisfaz a condição, em vez de
+                # lançar TypeError (as comparações de um AND podem ser reordenadas)
+                try:
+                    return compare(row_value, target_value)
+                except TypeError:
+                    return False
+            return compare(row_value, numeric_target)
         
+        return predicate
+    
+    def predicate(row):
+        row_value = row.get(column)
         # Se a coluna não existe na linha, retorna False
         if row_value is None:
             return False
+        # Valores numéricos são comparados pelo texto original, como no CSV
+        if not isinstance(row_value, str):
+            row_value = str(row_value)
+        return compare(row_value, target_value)
+    
+    return predicate
 
-        # Tenta converter valores para números, se aplicável
-        try:
-            # Verifica se o valor alvo é numérico
-            if isinstance(target_value, (int, float)) or (isinstance(target_value, str) and target_value.replace('.', '', 1).isdigit()):
-                # Converte o valor da linha para float, se possível
-                row_value = float(row_value) if isinstance(row_value, (str, int, float)) else row_value
-                target_value = float(target_value)
-        except (ValueError, TypeError):
-            # Ignora erros de conversão (mantém como string)
-            pass
-
-        # Realiza a comparação com base no operador
-        if op == '=':
-            return row_value == target_value
-        elif op == '<>':
-            return row_value != target_value
-        elif op == '<':
-            return row_value < target_value
-        elif op == '>':
-            return row_value > target_value
-        elif op == '<=':
-            return row_value <= target_value
-        elif op == '>=':
-            return row_value >= target_value
-    
-    # Retorna False se a condição não for válida
-    return False
-
-def select_rows(table_name, select_list, where_clause=None, limit=None):
+# Função que compila cada tipo de nó de condição (ex.: 'WHERE', 'AND', Op.EQ)
+CONDITION_COMPILERS = {
+    'WHERE': compile_where,
+    'AND': compile_and,
+    **dict.fromkeys(OPERATOR_FUNCTIONS, compile_comparison),
+}
+
+def compile_condition(condition):
+    """Compila uma condição do parser numa função aplicada a cada linha.
+    
+    A árvore da condição é percorrida uma única vez, escolhendo o compilador
+    de cada nó pelo seu tipo em CONDITION_COMPILERS.
+    
+    Args:
+        condition (tuple): Tupla com a condição do parser (ex.: (Op.EQ, 'coluna', valor)), predicado já compilado ou None.
+    
+    Returns:
+        function: Função que recebe uma linha (dict) e devolve True se a condição for satisfeita.
+    """
+    # Se não houver condição, aceita todas as linhas (sem filtro)
+    if condition is None:
+        return lambda row: True
+    
+    # Condições já compiladas (ex.: em procedimentos) são usadas tal como estão
+    if callable(condition):
+        return condition
+    
+    # Condições que não são tuplas (ou de tipo desconhecido) não são válidas
+    compiler = CONDITION_COMPILERS.get(condition[0]) if isinstance(condition, tuple) and condition else None
+    if compiler is None:
+        return lambda row: False
+    return compiler(condition)
+
+def select_rows(table_name, select_list, where_clause=None, limit=None, distinct=False):
     """Seleciona linhas de uma tabela com base em condições.
     
     Args:
@@ -70,6 +182,7 @@ def select_rows(table_name, select_list, where_clause=None, limit=None):
         select_list (str ou list): '*' para todas as colunas ou lista de nomes de colunas.
         where_clause (tuple): Tupla com a condição WHERE ou None.
         limit (str ou int): Número de linhas a limitar ou None.
+        distinct (bool): Se True, remove linhas repetidas (nas colunas selecionadas).
     
     Returns:
         list: Lista de dicionários com as linhas selecionadas ou None se a tabela não existir.
@@ -79,45 +192,221 @@ def select_rows(table_name, select_list, where_clause=None, limit=None):
         print(f"Erro: Tabela {table_name} não existe")
         return None
     
-    table = tables[table_name]
-    # Se a tabela estiver vazia, retorna uma lista vazia
-    if not table:
-        return []
+    return select_from_rows(tables[table_name], select_list, where_clause, limit, distinct)
+
+def parse_limit(limit):
+    """Converte o valor de LIMIT para int.
+    
+    Args:
+        limit (str ou int): Número de linhas a limitar ou None.
+    
+    Returns:
+        int: Limite de linhas, ou None se não houver LIMIT.
+    
+    Raises:
+        ValueError: Se o limite não for um inteiro não-negativo.
+    """
+    if limit is None:
+        return None
+    try:
+        value = int(limit)
+    except (ValueError, TypeError):
+        raise ValueError(f"Valor inválido para LIMIT {limit}")
+    if value < 0:
+        raise ValueError(f"Valor inválido para LIMIT {limit}")
+    return value
+
+def unique_rows(rows, row_key):
+    """Gera as linhas cuja chave ainda não apareceu (a primeira de cada grupo de repetidas).
+    
+    Um único dicionário ordenado (chave -> primeira linha) faz a deduplicação;
+    as linhas são produzidas à medida que entram nele, para que o resultado
+    possa ser consumido em streaming.
+    """
+    first_rows = {}
+    keep_first = first_rows.setdefault
+    for row in rows:
+        n_seen = len(first_rows)
+        # A chave é inserida uma única vez e o tamanho do dicionário indica se era nova (um só hash)
+        keep_first(row_key(row), row)
+        if len(first_rows) != n_seen:
+            yield row
+
+def column_projection(select_list):
+    """Cria a função que projeta uma linha nas colunas selecionadas.
+    
+    Os valores são extraídos de uma só vez por um itemgetter (em C); linhas
+    a que falte alguma coluna incluem apenas as colunas que existem.
     
-    # Filtra linhas com base na cláusula WHERE
-    filtered_rows = []
-    seen_rows = set()  # Evita duplicatas
-    for row in table:
-        if evaluate_condition(row, where_clause):
-            row_key = tuple(sorted(row.items()))  # Cria uma chave única para a linha
-            if row_key not in seen_rows:
-                seen_rows.add(row_key)
-                filtered_rows.append(row)
-    
-    # Valida e aplica o limite de linhas
-    if limit is not None:
+    Args:
+        select_list (list): Nomes das colunas selecionadas.
+    
+    Returns:
+        function: Função que recebe uma linha (dict) e devolve o dicionário projetado.
+    """
+    get_values = operator.itemgetter(*select_list)
+    # Com uma só coluna, o itemgetter devolve o valor em vez de uma tupla
+    pack = (lambda value: (value,)) if len(select_list) == 1 else tuple
+    
+    def project(row):
         try:
-            limit = int(limit)
-            if limit < 0:
-                raise ValueError("LIMIT deve ser não-negativo")
-            filtered_rows = filtered_rows[:limit]  # Limita o número de linhas
-        except (ValueError, TypeError):
-            print(f"Erro: Valor inválido para LIMIT {limit}")
-            return []
+            values = pack(get_values(row))
+        except KeyError:
+            return {col: row[col] for col in select_list if col in row}
+        return dict(zip(select_list, values))
+    
+    return project
+
+def row_from_key(select_list, key):
+    """Reconstrói uma linha projetada a partir dos valores das colunas selecionadas.
+    
+    Args:
+        select_list (list): Nomes das colunas selecionadas.
+        key (tuple): Valores das colunas, None para as que faltavam na linha original.
+    
+    Returns:
+        dict: Linha projetada, sem as colunas em falta.
+    """
+    if None in key:
+        return {col: value for col, value in zip(select_list, key) if value is not None}
+    return dict(zip(select_list, key))
+
+def iter_selected_rows(table, select_list, where_clause=None, limit=None, distinct=False):
+    """Aplica WHERE, DISTINCT, LIMIT e a projeção de colunas linha a linha.
+    
+    Nada é materializado: as linhas são produzidas à medida que são consumidas
+    e a filtragem termina assim que o LIMIT é atingido.
+    
+    Args:
+        table (list): Linhas (dicionários) de origem.
+        select_list (str ou list): '*' para todas as colunas ou lista de nomes de colunas.
+        where_clause (tuple): Tupla com a condição WHERE ou None.
+        limit (int): Número de linhas a limitar (já validado por parse_limit) ou None.
+        distinct (bool): Se True, remove linhas repetidas (nas colunas selecionadas).
+    
+    Returns:
+        iterador: Dicionários com as linhas selecionadas.
+    """
+    # Filtra linhas com base na cláusula WHERE; o filter() percorre a tabela
+    # em C e a condição é compilada uma única vez por consulta
+    if where_clause is None:
+        candidate_rows = table
+    else:
+        candidate_rows = filter(compile_condition(where_clause), table)
+    
+    if distinct and select_list != '*':
+        # Com colunas explícitas, projeção e deduplicação são feitas numa só
+        # passagem: a chave de duplicação já é a linha projetada (em tupla)
+        keys = map(lambda row: tuple(map(row.get, select_list)), candidate_rows)
+        if limit is None:
+            keys = dict.fromkeys(keys)  # Deduplica em C, preservando a ordem
+        else:
+            keys = islice(unique_rows(keys, lambda key: key), limit)
+        return map(partial(row_from_key, select_list), keys)
+    
+    if distinct:
+        # As linhas de uma tabela partilham a ordem das colunas, logo os valores bastam como chave
+        candidate_rows = unique_rows(candidate_rows, lambda row: tuple(row.values()))
+    
+    # Para de filtrar assim que o LIMIT é atingido
+    selected_rows = islice(candidate_rows, limit)
     
     # Seleciona colunas específicas, se não for '*'
     if select_list != '*':
-        result = []
-        for row in filtered_rows:
-            new_row = {col: row[col] for col in select_list if col in row}  # Inclui apenas colunas solicitadas
-            result.append(new_row)
-        return result
+        return map(column_projection(select_list), selected_rows)
+    return selected_rows
+
+def select_from_rows(table, select_list, where_clause=None, limit=None, distinct=False):
+    """Aplica WHERE, LIMIT e a projeção de colunas a uma lista de linhas.
     
-    return filtered_rows
+    Args:
+        table (list): Linhas (dicionários) de origem.
+        select_list (str ou list): '*' para todas as colunas, 'COUNT' para COUNT(*) ou lista de nomes de colunas.
+        where_clause (tuple): Tupla com a condição WHERE ou None.
+        limit (str ou int): Número de linhas a limitar ou None.
+        distinct (bool): Se True, remove linhas repetidas (nas colunas selecionadas).
+    
+    Returns:
+        list: Lista de dicionários com as linhas selecionadas (ou uma linha com a contagem).
+    """
+    # SELECT COUNT(*) só conta as linhas, sem construir o resultado
+    count_only = select_list == 'COUNT'
+    
+    # Se a tabela estiver vazia, retorna uma lista vazia
+    if not table and not count_only:
+        return []
+    
+    # Valida o limite de linhas antes de filtrar, para parar assim que for atingido
+    try:
+        limit = parse_limit(limit)
+    except ValueError as e:
+        print(f"Erro: {e}")
+        return []
+    
+    if count_only:
+        # COUNT(*) com DISTINCT conta as linhas distintas em todas as colunas; o LIMIT
+        # aplica-se à única linha do resultado e não limita a contagem
+        selected_rows = iter_selected_rows(table, '*', where_clause, None, distinct)
+        return [{'COUNT(*)': sum(1 for _ in selected_rows)}][:limit]
+    return list(iter_selected_rows(table, select_list, where_clause, limit, distinct))
+
+def parse_number(text):
+    """Converte um valor textual do CSV para int ou float.
+    
+    Args:
+        text (str): Valor lido do CSV.
+    
+    Returns:
+        int ou float: Valor numérico equivalente.
+    
+    Raises:
+        ValueError: Se o valor não for numérico ou se str(valor) não reproduzir o texto original.
+    """
+    value = int(text) if INTEGER_PATTERN.fullmatch(text) else float(text)
+    # Só aceita valores que voltam ao mesmo texto, para que PRINT e EXPORT não mudem
+    if str(value) != text:
+        raise ValueError(f"Valor não numérico: {text}")
+    return value
+
+def is_number_text(text):
+    """Verifica se um valor textual do CSV é aceite por parse_number."""
+    try:
+        parse_number(text)
+    except ValueError:
+        return False
+    return True
+
+def convert_numeric_columns(header, data):
+    """Converte, uma única vez, as colunas numéricas de uma tabela importada.
+    
+    Uma coluna é numérica se todos os seus valores forem aceites por parse_number;
+    caso contrário mantém-se como texto.
+    
+    Args:
+        header (list): Nomes das colunas candidatas a numéricas.
+        data (list): Linhas da tabela (dicionários), alteradas no próprio lugar.
+    """
+    for col in header:
+        # Converte no próprio lugar e para no primeiro valor não numérico, sem
+        # listas intermédias nem uma segunda passagem para verificar a coluna
+        try:
+            for row in data:
+                row[col] = parse_number(row[col])
+        except ValueError:
+            # Repõe o texto das linhas já convertidas (str(valor) reproduz o original)
+            for row in data:
+                value = row[col]
+                if isinstance(value, str):
+                    break
+                row[col] = str(value)
 
 def parse_csv_line(line, line_number):
     """Analisa uma linha de um arquivo CSV, respeitando aspas.
     
+    Cada linha física é lida isoladamente pelo módulo csv (em C), para que
+    umas aspas não fechadas não juntem a linha seguinte ao mesmo valor.
+    Texto após umas aspas fechadas (ex.: "a" ,b) é aceite, como antes.
+    
     Args:
         line (str): Linha do CSV a ser analisada.
         line_number (int): Número da linha para relatar erros.
@@ -128,84 +417,74 @@ def parse_csv_line(line, line_number):
     Raises:
         ValueError: Se houver aspas não fechadas.
     """
-    values = []
-    current = ''
-    in_quotes = False  # Indica se está dentro de aspas
-    i = 0
-    
-    while i < len(line):
-        char = line[i]
-        if char == '"':
-            if not in_quotes:
-                in_quotes = True  # Inicia uma string entre aspas
-            elif i + 1 < len(line) and line[i + 1] == '"':
-                current += '"'  # Trata aspas escapadas
-                i += 1
-            else:
-                in_quotes = False  # Finaliza a string entre aspas
-        elif char == ',' and not in_quotes:
-            values.append(current.strip())  # Adiciona o valor à lista
-            current = ''  # Reinicia para o próximo valor
-        else:
-            current += char  # Adiciona caractere ao valor atual
-        i += 1
-    
-    values.append(current.strip())  # Adiciona o último valor
-    if in_quotes:
-        raise ValueError(f"Aspas não fechadas na linha {line_number + 1}")
-    return values
+    try:
+        return next(csv.reader((line,), strict=True, skipinitialspace=True))
+    except csv.Error:
+        if line.count('"') % 2:
+            raise ValueError(f"Aspas não fechadas na linha {line_number + 1}") from None
+        return next(csv.reader((line,), skipinitialspace=True))
 
-def import_csv(file_name):
+def import_csv(file_name, row_filter=None):
     """Importa um arquivo CSV para uma lista de dicionários.
     
     Args:
         file_name (str): Caminho para o arquivo CSV.
+        row_filter (function): Predicado opcional; só as linhas aceites são guardadas.
     
     Returns:
         list: Lista de dicionários representando as linhas ou None em caso de erro.
     """
     try:
-        with open(file_name, 'r', encoding='utf-8') as file:
-            lines = []
-            # Lê o arquivo linha por linha
-            for i, line in enumerate(file):
-                line = line.strip()
-                # Ignora linhas vazias ou comentários
-                if not line or line.startswith('#'):
-                    continue
-                lines.append(line)
+        with open(file_name, 'r', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as file:
+            # Ignora linhas vazias ou comentários antes de chegar ao leitor CSV
+            lines = (line for line in map(str.strip, file) if line and not line.startswith('#'))
             
+            # Extrai o cabeçalho (primeira linha)
+            header_line = next(lines, None)
             # Verifica se o arquivo está vazio
-            if not lines:
+            if header_line is None:
                 raise ValueError("Arquivo vazio ou contém apenas comentários")
-            
-            # Extrai o cabeçalho (primeira linha)
-            header = parse_csv_line(lines[0], 0)
+            # Nomes de colunas internados: as chaves das linhas são partilhadas e comparadas por identidade
+            header = [sys.intern(col.strip()) for col in parse_csv_line(header_line, 0)]
             if not header:
                 raise ValueError("Cabeçalho inválido: vazio ou malformado")
             
             # Valida os nomes das colunas
             for col in header:
-                if not col.strip() or ',' in col:
+                if not col or ',' in col:
                     raise ValueError(f"Nome de coluna inválido: {col}")
             
             data = []
+            n_rows = 0
+            # Colunas que podem ser numéricas. As linhas descartadas pelo filtro
+            # também contam, para que os tipos sejam os de um IMPORT sem filtro
+            numeric_columns = header
             # Processa as linhas de dados
-            for i, line in enumerate(lines[1:], 1):
+            for i, line in enumerate(lines, 1):
                 try:
                     values = parse_csv_line(line, i)
-                    # Verifica se o número de valores corresponde ao cabeçalho
-                    if len(values) != len(header):
-                        print(f"Aviso: Linha {i+1} tem {len(values)} valores, esperado {len(header)}. Ignorando.")
-                        continue
-                    # Cria um dicionário para a linha
-                    row = {col: value for col, value in zip(header, values)}
-                    data.append(row)
-                except Exception as e:
+                except ValueError as e:
                     print(f"Aviso: Erro ao processar linha {i+1}: {str(e)}. Ignorando.")
                     continue
+                # Verifica se o número de valores corresponde ao cabeçalho
+                if len(values) != len(header):
+                    print(f"Aviso: Linha {i+1} tem {len(values)} valores, esperado {len(header)}. Ignorando.")
+                    continue
+                n_rows += 1
+                # O skipinitialspace só remove os espaços iniciais: remove também os
+                # finais de cada valor (ex.: "1 , A" dá '1' e 'A')
+                row = dict(zip(header, map(str.strip, values)))
+                # Descarta já na leitura as linhas que não passam no filtro
+                if row_filter is not None and not row_filter(row):
+                    if numeric_columns:
+                        numeric_columns = [col for col in numeric_columns if is_number_text(row[col])]
+                    continue
+                data.append(row)
+            
+            # Tipifica as colunas numéricas para evitar float() por linha nas consultas
+            convert_numeric_columns(numeric_columns, data)
             
-            print(f"Importadas {len(data)} linhas de {file_name}")
+            print(f"Importadas {n_rows} linhas de {file_name}")
             return data
     except FileNotFoundError:
         print(f"Erro: Arquivo {file_name} não encontrado")
@@ -214,6 +493,60 @@ def import_csv(file_name):
         print(f"Erro ao ler {file_name}: {str(e)}")
         return None
 
+def write_csv_rows(file, rows):
+    """Escreve o cabeçalho e as linhas de uma tabela com um csv.writer posicional.
+    
+    As colunas seguem a ordem da primeira linha; valores em falta ficam vazios,
+    como no DictWriter, mas sem a verificação de chaves por linha. As linhas
+    podem vir de um iterador, sendo escritas à medida que são produzidas.
+    
+    Args:
+        file: Arquivo de texto aberto para escrita.
+        rows (iterável): Linhas (dicionários) da tabela.
+    
+    Returns:
+        int: Número de linhas escritas (sem cabeçalho se não houver linhas).
+    """
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return 0
+    columns = list(first_row.keys())
+    blanks = [''] * len(columns)
+    n_rows = 0
+    
+    def counted_values():
+        """Gera os valores de cada linha, contando as linhas escritas."""
+        nonlocal n_rows
+        for n_rows, row in enumerate(chain((first_row,), rows), 1):
+            yield map(row.get, columns, blanks)
+    
+    writer = csv.writer(file)
+    writer.writerow(columns)
+    writer.writerows(counted_values())
+    return n_rows
+
+def export_rows(rows, file_name):
+    """Escreve linhas (lista ou iterador) num arquivo CSV.
+    
+    Args:
+        rows (iterável): Linhas (dicionários) a exportar.
+        file_name (str): Caminho do arquivo CSV de saída.
+    
+    Returns:
+        bool: True se bem-sucedido, False caso contrário.
+    """
+    try:
+        with open(file_name, 'w', encoding='utf-8', newline='', buffering=FILE_BUFFER_SIZE) as file:
+            n_rows = write_csv_rows(file, rows)  # Escreve o cabeçalho e as linhas
+            # Uma tabela vazia gera um arquivo vazio, sem mensagem
+            if n_rows:
+                print(f"Exportadas {n_rows} linhas para {file_name}")
+        return True
+    except Exception as e:
+        print(f"Erro ao escrever em {file_name}: {str(e)}")
+        return False
+
 def export_csv(table_name, file_name):
     """Exporta uma tabela para um arquivo CSV.
     
@@ -229,33 +562,86 @@ def export_csv(table_name, file_name):
         print(f"Erro: Tabela {table_name} não existe")
         return False
     
-    try:
-        with open(file_name, 'w', encoding='utf-8') as file:
-            # Se a tabela estiver vazia, retorna True
-            if not tables[table_name]:
-                return True
-            # Usa DictWriter para escrever o CSV
-            writer = csv.DictWriter(file, fieldnames=tables[table_name][0].keys())
-            writer.writeheader()  # Escreve o cabeçalho
-            writer.writerows(tables[table_name])  # Escreve as linhas
-            print(f"Exportadas {len(tables[table_name])} linhas para {file_name}")
-        return True
-    except Exception as e:
-        print(f"Erro ao escrever em {file_name}: {str(e)}")
-        return False
+    return export_rows(tables[table_name], file_name)
 
 def export_multiple_tables_csv(table_names, file_name):
     """Exporta múltiplas tabelas para um único arquivo CSV, separando por título e cabeçalho."""
-    with open(file_name, 'w', encoding='utf-8', newline='') as f:
+    with open(file_name, 'w', encoding='utf-8', newline='', buffering=FILE_BUFFER_SIZE) as f:
         for idx, table_name in enumerate(table_names):
             if table_name in tables and tables[table_name]:
                 f.write(f"==== {table_name} ====" + "\n")
-                writer = csv.DictWriter(f, fieldnames=tables[table_name][0].keys())
-                writer.writeheader()
-                writer.writerows(tables[table_name])
+                write_csv_rows(f, tables[table_name])
                 f.write("\n")
     print(f"Tabelas {', '.join(table_names)} exportadas para {file_name}")
 
+def join_key(value):
+    """Normaliza um valor da coluna de junção para o seu texto original.
+    
+    O tipo das colunas é decidido por tabela na importação, logo a mesma
+    coluna pode ser int numa tabela e texto noutra; nesse caso, como
+    parse_number garante que str(valor) reproduz o texto do CSV, as chaves
+    são comparadas como texto.
+    
+    Args:
+        value: Valor da coluna (None se a coluna faltar).
+    
+    Returns:
+        str: Texto do valor, ou None se a coluna faltar.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+def column_types(table, column):
+    """Devolve (em C) o conjunto de tipos dos valores de uma coluna, sem contar as linhas sem ela."""
+    types = set(map(type, map(operator.methodcaller('get', column), table)))
+    types.discard(type(None))
+    return types
+
+def join_keys(table, column, normalize):
+    """Extrai (em C) as chaves de junção de todas as linhas de uma tabela.
+    
+    Args:
+        table (list): Linhas da tabela.
+        column (str): Coluna de junção.
+        normalize (bool): Se True, as chaves passam por join_key; senão são os valores tal como estão.
+    """
+    keys = map(operator.methodcaller('get', column), table)
+    return map(join_key, keys) if normalize else keys
+
+def get_join_index(table_name, column, normalize):
+    """Devolve o índice de hash de uma tabela por uma coluna, construindo-o se preciso.
+    
+    O índice fica em cache até a tabela ser alterada (ver invalidate_indexes);
+    é também reconstruído se a lista de linhas guardada já não for a atual.
+    
+    Args:
+        table_name (str): Nome da tabela (tem de existir).
+        column (str): Coluna indexada.
+        normalize (bool): Se as chaves são normalizadas para texto (ver join_key).
+    
+    Returns:
+        dict: Valor da coluna -> linha (a última linha com esse valor); linhas sem a coluna não entram.
+    """
+    table = tables[table_name]
+    cached = table_indexes.get((table_name, column, normalize))
+    if cached is not None and cached[0] is table:
+        return cached[1]
+    
+    # Cria o dicionário (tabela de hash) a partir das chaves da coluna
+    index = dict(zip(join_keys(table, column, normalize), table))
+    index.pop(None, None)
+    table_indexes[(table_name, column, normalize)] = (table, index)
+    return index
+
+def invalidate_indexes(table_name=None):
+    """Descarta os índices de junção de uma tabela, ou todos se table_name for None."""
+    if table_name is None:
+        table_indexes.clear()
+        return
+    for key in [key for key in table_indexes if key[0] == table_name]:
+        del table_indexes[key]
+
 def join_tables(table1_name, table2_name, join_column):
     """Junta duas tabelas com base em uma coluna comum.
     
@@ -279,29 +665,38 @@ def join_tables(table1_name, table2_name, join_column):
     if not table1 or not table2:
         return []
     
-    # Cria um dicionário para a segunda tabela, usando a coluna de junção como chave
-    table2_dict = {}
-    for row in table2:
-        key = row.get(join_column)
-        if key is not None:
-            table2_dict[key] = row
+    # Só normaliza as chaves para texto se a coluna não tiver o mesmo tipo nas
+    # duas tabelas (ex.: int numa e texto noutra); senão compara os valores diretamente
+    normalize = len(column_types(table1, join_column) | column_types(table2, join_column)) > 1
+    
+    # Índice de hash da segunda tabela pela coluna de junção (reutilizado entre junções)
+    table2_dict = get_join_index(table2_name, join_column, normalize)
     
+    # Cada chave tem uma única linha em table2_dict, logo cada linha de
+    # table1 gera no máximo uma linha mesclada e não é preciso deduplicar
     result = []
-    seen_rows = set()  # Evita duplicatas
-    for row1 in table1:
-        key = row1.get(join_column)
+    for row1, key in zip(table1, join_keys(table1, join_column, normalize)):
+        row2 = table2_dict.get(key)
         # Se a chave existe na segunda tabela, mescla as linhas
-        if key in table2_dict:
-            merged_row = row1.copy()
-            merged_row.update(table2_dict[key])  # Combina os dados
-            row_key = tuple(sorted(merged_row.items()))  # Cria chave única
-            if row_key not in seen_rows:
-                seen_rows.add(row_key)
-                result.append(merged_row)
+        if row2 is not None:
+            result.append({**row1, **row2})  # Combina os dados (a segunda tabela prevalece)
     
     print(f"Juntadas {len(result)} linhas de {table1_name} e {table2_name}")
     return result
 
+def write_lines(lines):
+    """Escreve linhas no stdout em blocos, em vez de um print() por linha.
+    
+    Args:
+        lines (iterável): Linhas de texto (sem quebra de linha).
+    """
+    iterator = iter(lines)
+    while True:
+        chunk = list(islice(iterator, OUTPUT_CHUNK_LINES))
+        if not chunk:
+            break
+        sys.stdout.write('\n'.join(chunk) + '\n')
+
 def print_table(table_data, table_title):
     if not table_data:
         print(f"\nTabela: {table_title} está vazia")
@@ -312,8 +707,300 @@ def print_table(table_data, table_title):
     header = " | ".join(col.ljust(widths[col]) for col in columns)
     print(header)
     print("-" * len(header))
-    for row in table_data:
-        print(" | ".join(str(row.get(col, "")).ljust(widths[col]) for col in columns))
+    write_lines(" | ".join(str(row.get(col, "")).ljust(widths[col]) for col in columns) for row in table_data)
+
+def references_name(node, name):
+    """Verifica se um comando (ou parte dele) menciona um nome.
+    
+    A verificação é conservadora: qualquer string igual a name conta.
+    
+    Args:
+        node: Comando analisado pelo parser (tuplas e listas aninhadas).
+        name (str): Nome a procurar.
+    
+    Returns:
+        bool: True se o nome aparecer no comando.
+    """
+    if isinstance(node, (tuple, list)):
+        return any(references_name(child, name) for child in node)
+    return node == name
+
+def is_dead_table(table_name, statements, context=None):
+    """Verifica se uma tabela deixa de ser usada a partir de statements.
+    
+    Args:
+        table_name (str): Nome da tabela.
+        statements (list): Comandos que ainda serão executados.
+        context (list): Outros comandos que podem usar a tabela; por omissão, os procedimentos.
+    
+    Returns:
+        bool: True se nem esses comandos, nem o contexto, nem CALL EXPORT_TODAS_TABELAS a usam.
+    """
+    if context is None:
+        context = list(procedures.values())
+    return (table_name not in EXPORT_TODAS_TABELAS
+            and not references_name(statements, table_name)
+            and not references_name(context, table_name))
+
+def optimize_statements(statements, context=None):
+    """Reescreve pares de comandos que podem ser executados sem tabelas intermédias.
+    
+    Quando a tabela intermédia não volta a ser usada (nem nos comandos
+    seguintes, nem no contexto, que por omissão são os procedimentos):
+    
+    - IMPORT seguido de CREATE ... SELECT ... WHERE sobre a mesma tabela é
+      substituído por um único IMPORT_FILTERED, que aplica o WHERE durante a
+      leitura do CSV, sem guardar as linhas que seriam descartadas;
+    - CREATE ... SELECT seguido do EXPORT da nova tabela é substituído por um
+      único EXPORT_SELECT, que escreve as linhas no CSV à medida que são
+      selecionadas, sem guardar a tabela.
+    
+    Args:
+        statements (list): Comandos analisados pelo parser.
+        context (list): Outros comandos que podem usar as tabelas intermédias (ver is_dead_table).
+    
+    Returns:
+        list: Comandos a executar.
+    """
+    optimized = []
+    i = 0
+    while i < len(statements):
+        statement = statements[i]
+        following = statements[i + 1] if i + 1 < len(statements) else None
+        if (statement and statement[0] == 'IMPORT'
+                and following and following[0] == 'CREATE_FROM_SELECT'):
+            _, table_name, file_name = statement
+            _, new_table, select_stmt = following
+            if (select_stmt[2] == table_name and select_stmt[3] is not None
+                    and new_table != table_name
+                    and is_dead_table(table_name, statements[i + 2:], context)):
+                optimized.append(('IMPORT_FILTERED', table_name, file_name, new_table, select_stmt))
+                i += 2
+                continue
+        if (statement and statement[0] == 'CREATE_FROM_SELECT'
+                and following and following[0] == 'EXPORT'):
+            _, new_table, select_stmt = statement
+            _, table_name, file_name = following
+            if (table_name == new_table and select_stmt[2] != new_table
+                    and is_dead_table(new_table, statements[i + 2:], context)):
+                optimized.append(('EXPORT_SELECT', new_table, select_stmt, file_name))
+                i += 2
+                continue
+        optimized.append(statement)
+        i += 1
+    return optimized
+
+def execute_import(statement):
+    """Executa IMPORT TABLE tabela FROM "arquivo";"""
+    _, table_name, file_name = statement
+    data = import_csv(file_name)
+    if data is not None:
+        tables[table_name] = data  # Armazena a tabela em memória
+        invalidate_indexes(table_name)
+
+def execute_import_filtered(statement):
+    """Executa o IMPORT_FILTERED gerado por optimize_statements."""
+    # ('IMPORT_FILTERED', tabela, arquivo, nova_tabela, select)
+    _, table_name, file_name, new_table, select_stmt = statement
+    data = import_csv(file_name, compile_condition(select_stmt[3]))
+    if data is None:
+        # A importação falhou: executa o CREATE original para reproduzir os mesmos erros
+        execute_statement(('CREATE_FROM_SELECT', new_table, select_stmt))
+        return
+    tables[new_table] = select_from_rows(data, select_stmt[1], None, select_stmt[4], distinct=True)
+    invalidate_indexes(new_table)
+    print(f"Tabela {new_table} criada a partir de SELECT")
+
+def execute_export_select(statement):
+    """Executa o EXPORT_SELECT gerado por optimize_statements."""
+    # ('EXPORT_SELECT', nova_tabela, select, arquivo)
+    _, new_table, select_stmt, file_name = statement
+    table = tables.get(select_stmt[2])
+    try:
+        limit = parse_limit(select_stmt[4])
+    except ValueError:
+        limit = None
+        table = None
+    if not table or select_stmt[1] == 'COUNT':
+        # Tabela em falta, vazia, LIMIT inválido ou COUNT(*): executa os comandos
+        # originais para reproduzir as mesmas mensagens e o mesmo arquivo
+        execute_statement(('CREATE_FROM_SELECT', new_table, select_stmt))
+        execute_statement(('EXPORT', new_table, file_name))
+        return
+    print(f"Tabela {new_table} criada a partir de SELECT")
+    # Tabelas criadas por SELECT nunca têm linhas repetidas
+    export_rows(iter_selected_rows(table, select_stmt[1], select_stmt[3], limit, distinct=True), file_name)
+
+def execute_export(statement):
+    """Executa EXPORT TABLE tabela AS "arquivo";"""
+    _, table_name, file_name = statement
+    export_csv(table_name, file_name)  # Exporta a tabela
+
+def execute_discard(statement):
+    """Executa DISCARD TABLE tabela;"""
+    _, table_name = statement
+    if table_name in tables:
+        del tables[table_name]  # Remove a tabela
+        invalidate_indexes(table_name)
+        print(f"Tabela {table_name} descartada")
+    else:
+        print(f"Erro: Tabela {table_name} não existe")
+
+def execute_rename(statement):
+    """Executa RENAME TABLE antigo novo;"""
+    _, old_name, new_name = statement
+    if old_name in tables:
+        tables[new_name] = tables.pop(old_name)  # Renomeia a tabela
+        invalidate_indexes(old_name)
+        invalidate_indexes(new_name)
+        print(f"Tabela {old_name} renomeada para {new_name}")
+    else:
+        print(f"Erro: Tabela {old_name} não existe")
+
+def execute_print(statement):
+    """Executa PRINT TABLE tabela; (com título opcional)."""
+    # Suporte a ('PRINT', tabela) ou ('PRINT', tabela, nome_customizado)
+    if len(statement) == 2:
+        _, table_name = statement
+        table_title = table_name
+    else:
+        _, table_name, table_title = statement
+    if table_name in tables:
+        print_table(tables[table_name], table_title)
+    else:
+        print(f"Erro: Tabela {table_name} não existe")
+
+def execute_select(statement):
+    """Executa SELECT e exibe o resultado."""
+    _, select_list, table_name, where_clause, limit, distinct = statement
+    result = select_rows(table_name, select_list, where_clause, limit, distinct)
+    if result is not None:
+        print("\nResultado da Consulta:")
+        write_lines(map(repr, result))  # Exibe os resultados da consulta
+
+def execute_create_from_select(statement):
+    """Executa CREATE TABLE nova SELECT ...;"""
+    _, new_table, select_stmt = statement
+    # Tabelas criadas por SELECT nunca têm linhas repetidas
+    result = select_rows(select_stmt[2], select_stmt[1], select_stmt[3], select_stmt[4], distinct=True)
+    if result is not None:
+        tables[new_table] = result  # Cria nova tabela com resultado de SELECT
+        invalidate_indexes(new_table)
+        print(f"Tabela {new_table} criada a partir de SELECT")
+
+def execute_create_from_join(statement):
+    """Executa CREATE TABLE nova FROM t1 JOIN t2 USING(coluna);"""
+    _, new_table, table1, table2, join_column = statement
+    result = join_tables(table1, table2, join_column)
+    if result is not None:
+        tables[new_table] = result  # Cria nova tabela com resultado de JOIN
+        invalidate_indexes(new_table)
+        print(f"Tabela {new_table} criada a partir de JOIN")
+
+def execute_procedure(statement):
+    """Executa PROCEDURE nome DO ... END; compilando o corpo uma única vez."""
+    _, proc_name, statements = statement
+    procedures[proc_name] = statements  # Armazena o procedimento
+    compiled_procedures[proc_name] = compile_procedure(proc_name, statements)
+    print(f"Procedimento {proc_name} definido")
+
+def execute_call(statement):
+    """Executa CALL nome; usando o corpo já compilado do procedimento."""
+    _, proc_name = statement
+    if proc_name in procedures:
+        # Procedimentos registados só pelo parser são compilados no primeiro CALL
+        if proc_name not in compiled_procedures:
+            compiled_procedures[proc_name] = compile_procedure(proc_name, procedures[proc_name])
+        for run in compiled_procedures[proc_name]:
+            run()  # Executa cada comando do procedimento
+    elif proc_name == 'EXPORT_TODAS_TABELAS':
+        export_multiple_tables_csv(EXPORT_TODAS_TABELAS, 'dados_completos_multitabelas.csv')
+    else:
+        print(f"Erro: Procedimento {proc_name} não existe")
+
+def execute_update(statement):
+    """Executa UPDATE tabela SET campo = "valor" WHERE campo = "valor";"""
+    # ('UPDATE_DATAHORA', tabela, campo, novo_valor, campo_where, valor_where)
+    _, tabela, campo, novo_valor, campo_where, valor_where = statement
+    if tabela in tables:
+        count = 0
+        for row in tables[tabela]:
+            valor = row.get(campo_where)
+            # Colunas numéricas são comparadas pelo texto original
+            if valor is not None and not isinstance(valor, str):
+                valor = str(valor)
+            if valor == valor_where:
+                row[campo] = novo_valor
+                count += 1
+        # As linhas podem ser partilhadas com tabelas criadas por SELECT: descarta todos os índices
+        invalidate_indexes()
+        print(f"{count} registro(s) atualizado(s) em {tabela}.")
+    else:
+        print(f"Tabela {tabela} não encontrada.")
+
+def execute_print_avg(statement):
+    """Executa PRINT AVG(coluna) FROM tabela;"""
+    # ('PRINT_AVG', coluna, tabela)
+    _, coluna, tabela = statement
+    if tabela in tables:
+        valores = [float(row[coluna]) for row in tables[tabela] if row.get(coluna) not in (None, '', 'NULL')]
+        if valores:
+            media = sum(valores) / len(valores)
+            print(f"AVG({coluna}) FROM {tabela} = {media:.2f}")
+        else:
+            print(f"Nenhum valor válido encontrado para {coluna} em {tabela}.")
+    else:
+        print(f"Tabela {tabela} não encontrada.")
+
+def execute_print_string(statement):
+    """Executa PRINT "mensagem";"""
+    # ('PRINT_STRING', mensagem)
+    print(statement[1])
+
+def execute_export_avg(statement):
+    """Executa EXPORT AVG(coluna) FROM tabela AS "arquivo";"""
+    # ('EXPORT_AVG', coluna, tabela, arquivo)
+    _, coluna, tabela, arquivo = statement
+    if tabela in tables:
+        valores = [float(row[coluna]) for row in tables[tabela] if row.get(coluna) not in (None, '', 'NULL')]
+        if valores:
+            media = sum(valores) / len(valores)
+            with open(arquivo, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow([f'AVG_{coluna}'])
+                writer.writerow([f'{media:.2f}'])
+            print(f"Média exportada para {arquivo}")
+        else:
+            print(f"Nenhum valor válido encontrado para {coluna} em {tabela}.")
+    else:
+        print(f"Tabela {tabela} não encontrada.")
+
+# Função que executa cada tipo de comando (ex.: 'SELECT', 'IMPORT')
+STATEMENT_HANDLERS = {
+    'IMPORT': execute_import,
+    'IMPORT_FILTERED': execute_import_filtered,
+    'EXPORT': execute_export,
+    'EXPORT_SELECT': execute_export_select,
+    'DISCARD': execute_discard,
+    'RENAME': execute_rename,
+    'PRINT': execute_print,
+    'SELECT': execute_select,
+    'CREATE_FROM_SELECT': execute_create_from_select,
+    'CREATE_FROM_JOIN': execute_create_from_join,
+    'PROCEDURE': execute_procedure,
+    'CALL': execute_call,
+    'UPDATE_DATAHORA': execute_update,
+    'PRINT_AVG': execute_print_avg,
+    'PRINT_STRING': execute_print_string,
+    'EXPORT_AVG': execute_export_avg,
+}
+
+def run_handler(handler, statement):
+    """Executa um comando com o seu handler, reportando erros sem interromper o programa."""
+    try:
+        handler(statement)
+    except Exception as e:
+        print(f"Erro ao executar comando {statement[0]}: {str(e)}")
 
 def execute_statement(statement):
     """Executa um comando CQL analisado.
@@ -325,133 +1012,56 @@ def execute_statement(statement):
     if not statement:
         return
     
-    stmt_type = statement[0]  # Tipo do comando (ex.: 'SELECT', 'IMPORT')
-    try:
-        if stmt_type == 'IMPORT':
-            _, table_name, file_name = statement
-            data = import_csv(file_name)
-            if data is not None:
-                tables[table_name] = data  # Armazena a tabela em memória
-        
-        elif stmt_type == 'EXPORT':
-            _, table_name, file_name = statement
-            export_csv(table_name, file_name)  # Exporta a tabela
-        
-        elif stmt_type == 'DISCARD':
-            _, table_name = statement
-            if table_name in tables:
-                del tables[table_name]  # Remove a tabela
-                print(f"Tabela {table_name} descartada")
-            else:
-                print(f"Erro: Tabela {table_name} não existe")
-        
-        elif stmt_type == 'RENAME':
-            _, old_name, new_name = statement
-            if old_name in tables:
-                tables[new_name] = tables.pop(old_name)  # Renomeia a tabela
-                print(f"Tabela {old_name} renomeada para {new_name}")
-            else:
-                print(f"Erro: Tabela {old_name} não existe")
-        
-        elif stmt_type == 'PRINT':
-            # Suporte a ('PRINT', tabela) ou ('PRINT', tabela, nome_customizado)
-            if len(statement) == 2:
-                _, table_name = statement
-                table_title = table_name
-            else:
-                _, table_name, table_title = statement
-            if table_name in tables:
-                print_table(tables[table_name], table_title)
-            else:
-                print(f"Erro: Tabela {table_name} não existe")
-        
-        elif stmt_type == 'SELECT':
-            _, select_list, table_name, where_clause, limit = statement
-            result = select_rows(table_name, select_list, where_clause, limit)
-            if result is not None:
-                print("\nResultado da Consulta:")
-                for row in result:
-                    print(row)  # Exibe os resultados da consulta
-        
-        elif stmt_type == 'CREATE_FROM_SELECT':
-            _, new_table, select_stmt = statement
-            result = select_rows(select_stmt[2], select_stmt[1], select_stmt[3], select_stmt[4])
-            if result is not None:
-                tables[new_table] = result  # Cria nova tabela com resultado de SELECT
-                print(f"Tabela {new_table} criada a partir de SELECT")
-        
-        elif stmt_type == 'CREATE_FROM_JOIN':
-            _, new_table, table1, table2, join_column = statement
-            result = join_tables(table1, table2, join_column)
-            if result is not None:
-                tables[new_table] = result  # Cria nova tabela com resultado de JOIN
-                print(f"Tabela {new_table} criada a partir de JOIN")
-        
-        elif stmt_type == 'PROCEDURE':
-            _, proc_name, statements = statement
-            procedures[proc_name] = statements  # Armazena o procedimento
-            print(f"Procedimento {proc_name} definido")
-        
-        elif stmt_type == 'CALL':
-            _, proc_name = statement
-            if proc_name in procedures:
-                for stmt in procedures[proc_name]:
-                    execute_statement(stmt)  # Executa cada comando do procedimento
-            elif statement[1] == 'EXPORT_TODAS_TABELAS':
-                export_multiple_tables_csv(['temps_altas', 'dados_completos', 'temperaturas_altas'], 'dados_completos_multitabelas.csv')
-                return
-            else:
-                print(f"Erro: Procedimento {proc_name} não existe")
-        
-        elif stmt_type == 'UPDATE_DATAHORA':
-            # ('UPDATE_DATAHORA', tabela, campo, novo_valor, campo_where, valor_where)
-            _, tabela, campo, novo_valor, campo_where, valor_where = statement
-            if tabela in tables:
-                count = 0
-                for row in tables[tabela]:
-                    if row.get(campo_where) == valor_where:
-                        row[campo] = novo_valor
-                        count += 1
-                print(f"{count} registro(s) atualizado(s) em {tabela}.")
-            else:
-                print(f"Tabela {tabela} não encontrada.")
-        
-        elif stmt_type == 'PRINT_AVG':
-            # ('PRINT_AVG', coluna, tabela)
-            _, coluna, tabela = statement
-            if tabela in tables:
-                valores = [float(row[coluna]) for row in tables[tabela] if row.get(coluna) not in (None, '', 'NULL')]
-                if valores:
-                    media = sum(valores) / len(valores)
-                    print(f"AVG({coluna}) FROM {tabela} = {media:.2f}")
-                else:
-                    print(f"Nenhum valor válido encontrado para {coluna} em {tabela}.")
-            else:
-                print(f"Tabela {tabela} não encontrada.")
-        
-        elif stmt_type == 'PRINT_STRING':
-            # ('PRINT_STRING', mensagem)
-            print(statement[1])
-        
-        elif stmt_type == 'EXPORT_AVG':
-            # ('EXPORT_AVG', coluna, tabela, arquivo)
-            _, coluna, tabela, arquivo = statement
-            if tabela in tables:
-                valores = [float(row[coluna]) for row in tables[tabela] if row.get(coluna) not in (None, '', 'NULL')]
-                if valores:
-                    media = sum(valores) / len(valores)
-                    with open(arquivo, 'w', newline='', encoding='utf-8') as csvfile:
-                        writer = csv.writer(csvfile)
-                        writer.writerow([f'AVG_{coluna}'])
-                        writer.writerow([f'{media:.2f}'])
-                    print(f"Média exportada para {arquivo}")
-                else:
-                    print(f"Nenhum valor válido encontrado para {coluna} em {tabela}.")
-            else:
-                print(f"Tabela {tabela} não encontrada.")
+    handler = STATEMENT_HANDLERS.get(statement[0])
+    if handler is not None:
+        run_handler(handler, statement)
+
+def compile_statement(statement):
+    """Prepara um comando para ser executado várias vezes (ex.: dentro de um procedimento).
     
-    except Exception as e:
-        print(f"Erro ao executar comando {stmt_type}: {str(e)}")
+    O handler é resolvido uma única vez e as cláusulas WHERE são compiladas
+    antecipadamente.
+    
+    Args:
+        statement (tuple): Tupla com o comando analisado pelo parser.
+    
+    Returns:
+        function: Função sem argumentos que executa o comando.
+    """
+    handler = STATEMENT_HANDLERS.get(statement[0]) if statement else None
+    if handler is None:
+        return lambda: None
+    
+    # Substitui a condição WHERE pelo predicado já compilado (os nós do parser
+    # são NamedTuples, logo podem ser reconhecidos com match/case)
+    match statement:
+        case Select(where=where) if where is not None:
+            statement = statement._replace(where=compile_condition(where))
+        case CreateFromSelect(select=Select(where=where) as select_stmt) if where is not None:
+            statement = statement._replace(select=select_stmt._replace(where=compile_condition(where)))
+        case ('EXPORT_SELECT', new_table, Select(where=where) as select_stmt, file_name) if where is not None:
+            statement = ('EXPORT_SELECT', new_table, select_stmt._replace(where=compile_condition(where)), file_name)
+    
+    return partial(run_handler, handler, statement)
+
+def compile_procedure(proc_name, statements):
+    """Compila o corpo de um procedimento numa lista de funções prontas a executar.
+    
+    O corpo passa também por optimize_statements. Como o procedimento pode ser
+    chamado em qualquer ponto, uma tabela intermédia só é descartada se não
+    for usada em nenhum outro comando do script nem noutro procedimento.
+    
+    Args:
+        proc_name (str): Nome do procedimento.
+        statements (tuple): Comandos do corpo do procedimento.
+    
+    Returns:
+        list: Funções sem argumentos que executam cada comando.
+    """
+    context = [statement for statement in script_statements
+               if not (statement and statement[0] == 'PROCEDURE' and statement[1] == proc_name)]
+    context += [body for name, body in procedures.items() if name != proc_name]
+    return [compile_statement(statement) for statement in optimize_statements(list(statements), context)]
 
 def main():
     """Função principal para executar o interpretador CQL."""
@@ -480,9 +1090,14 @@ def main():
         # Analisa a entrada com o lexer e parser
         result = parser.parse(input_text, lexer=lexer)
         if result:
+            script_statements[:] = result
+            result = optimize_statements(result)
             # Executa cada comando analisado
             for statement in result:
                 execute_statement(statement)
+    except ParseError as e:
+        # Scripts com erros de sintaxe não são executados
+        print(str(e))
     except Exception as e:
         print(f"Erro: {str(e)}")
 
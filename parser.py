@@ -1,3 +1,5 @@
+from enum import IntEnum
+from typing import Any, NamedTuple
 import ply.yacc as yacc
 from lexer import tokens, lexer
 
@@ -7,6 +9,156 @@ tables = {}
 # Dictionary to store procedures
 procedures = {}
 
+class Op(IntEnum):
+    """Comparison operators, as stored in Comparison nodes."""
+    EQ = 0
+    NE = 1
+    LT = 2
+    GT = 3
+    LE = 4
+    GE = 5
+
+# Comparison operator lexeme -> Op tag
+COMPARISON_OPERATORS = {'=': Op.EQ, '<>': Op.NE, '<': Op.LT, '>': Op.GT, '<=': Op.LE, '>=': Op.GE}
+
+# AST nodes. Each node is a NamedTuple whose first field is the statement tag,
+# so it can still be indexed and unpacked like the plain tuples it replaces.
+
+class Import(NamedTuple):
+    """IMPORT TABLE table FROM "file";"""
+    tag: str
+    table: str
+    file: str
+
+class Export(NamedTuple):
+    """EXPORT TABLE table AS "file";"""
+    tag: str
+    table: str
+    file: str
+
+class ExportAvg(NamedTuple):
+    """EXPORT AVG(column) FROM table AS "file";"""
+    tag: str
+    column: str
+    table: str
+    file: str
+
+class Discard(NamedTuple):
+    """DISCARD TABLE table;"""
+    tag: str
+    table: str
+
+class Rename(NamedTuple):
+    """RENAME TABLE old_name new_name;"""
+    tag: str
+    old_name: str
+    new_name: str
+
+class Print(NamedTuple):
+    """PRINT TABLE table;"""
+    tag: str
+    table: str
+
+class PrintAs(NamedTuple):
+    """PRINT TABLE table AS "title";"""
+    tag: str
+    table: str
+    title: str
+
+class PrintAvg(NamedTuple):
+    """PRINT AVG(column) FROM table;"""
+    tag: str
+    column: str
+    table: str
+
+class PrintString(NamedTuple):
+    """PRINT "message";"""
+    tag: str
+    message: str
+
+class Select(NamedTuple):
+    """SELECT [DISTINCT] columns FROM table [WHERE condition] [LIMIT n];"""
+    tag: str
+    columns: Any  # '*', 'COUNT' or a list of column names
+    table: str
+    where: Any  # Where node or None
+    limit: Any  # int or None
+    distinct: bool
+
+class CreateFromSelect(NamedTuple):
+    """CREATE TABLE table SELECT ...;"""
+    tag: str
+    table: str
+    select: Select
+
+class CreateFromJoin(NamedTuple):
+    """CREATE TABLE table FROM left JOIN right USING (column);"""
+    tag: str
+    table: str
+    left: str
+    right: str
+    column: str
+
+class Procedure(NamedTuple):
+    """PROCEDURE name DO statements END;"""
+    tag: str
+    name: str
+    statements: tuple
+
+class Call(NamedTuple):
+    """CALL name;"""
+    tag: str
+    name: str
+
+class UpdateDataHora(NamedTuple):
+    """UPDATE table SET column = "value" WHERE where_column = "where_value";"""
+    tag: str
+    table: str
+    column: str
+    value: str
+    where_column: str
+    where_value: str
+
+class Where(NamedTuple):
+    """WHERE clause wrapping its condition."""
+    tag: str
+    condition: Any
+
+class And(NamedTuple):
+    """Conjunction of conditions (a AND b AND c is a single node)."""
+    tag: str
+    conditions: list
+
+class Comparison(NamedTuple):
+    """Comparison between a column and a value (e.g. Temperatura > 20)."""
+    op: Op
+    column: str
+    value: Any
+
+class ParseError(Exception):
+    """Syntax error found by the parser.
+
+    Holds the offending token's type, value, line and position; all of them
+    are None when the error is at the end of the input.
+    """
+    __slots__ = ('token_type', 'value', 'lineno', 'lexpos')
+
+    def __init__(self, token_type=None, value=None, lineno=None, lexpos=None):
+        self.token_type = token_type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        if token_type is None:
+            message = "Syntax error at EOF"
+        else:
+            message = f"Syntax error at token {token_type} (value: {value}) at line {lineno}, position {lexpos}"
+        super().__init__(message)
+
+    @classmethod
+    def eof(cls):
+        """Build the error raised when the input ends unexpectedly."""
+        return cls()
+
 # Operator precedence to resolve conflicts
 precedence = (
     ('left', 'AND'),
@@ -24,7 +176,8 @@ def p_statement_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_statement(p):
     '''statement : import_statement
@@ -43,62 +196,83 @@ def p_statement(p):
 def p_import_statement(p):
     '''import_statement : IMPORT TABLE ID FROM STRING SEMICOLON'''
     """Parse IMPORT TABLE table_name FROM "filename";"""
-    p[0] = ('IMPORT', p[3], p[5])
+    p[0] = Import('IMPORT', p[3], p[5])
 
 def p_export_statement(p):
     '''export_statement : EXPORT TABLE ID AS STRING SEMICOLON
                        | EXPORT AVG LPAREN ID RPAREN FROM ID AS STRING SEMICOLON'''
     """Parse EXPORT TABLE table_name AS "filename"; or EXPORT AVG(column) FROM table AS "filename";"""
     if len(p) == 7:
-        p[0] = ('EXPORT', p[3], p[5])
+        p[0] = Export('EXPORT', p[3], p[5])
     else:
-        p[0] = ('EXPORT_AVG', p[4], p[7], p[9])
+        p[0] = ExportAvg('EXPORT_AVG', p[4], p[7], p[9])
 
 def p_discard_statement(p):
     '''discard_statement : DISCARD TABLE ID SEMICOLON'''
     """Parse DISCARD TABLE table_name;"""
-    p[0] = ('DISCARD', p[3])
+    p[0] = Discard('DISCARD', p[3])
 
 def p_rename_statement(p):
     '''rename_statement : RENAME TABLE ID ID SEMICOLON'''
     """Parse RENAME TABLE old_name new_name;"""
-    p[0] = ('RENAME', p[3], p[4])
+    p[0] = Rename('RENAME', p[3], p[4])
 
-def p_print_statement(p):
-    '''print_statement : PRINT TABLE ID SEMICOLON
-                      | PRINT TABLE ID AS STRING SEMICOLON
-                      | PRINT AVG LPAREN ID RPAREN FROM ID SEMICOLON
-                      | PRINT STRING SEMICOLON'''
-    if len(p) == 5:
-        p[0] = ('PRINT', p[3])
-    elif len(p) == 6:
-        p[0] = ('PRINT', p[3], p[5])
-    elif len(p) == 9:
-        p[0] = ('PRINT_AVG', p[4], p[7])
-    elif len(p) == 4:
-        p[0] = ('PRINT_STRING', p[2])
-
-def p_select_statement(p):
-    '''select_statement : SELECT select_list FROM ID where_clause limit_clause SEMICOLON
-                       | SELECT select_list FROM ID where_clause SEMICOLON
-                       | SELECT select_list FROM ID limit_clause SEMICOLON
-                       | SELECT select_list FROM ID SEMICOLON'''
-    """Parse SELECT queries with optional WHERE and LIMIT clauses."""
-    if len(p) == 8:
-        p[0] = ('SELECT', p[2], p[4], p[5], p[6])
-    elif len(p) == 7:
-        if isinstance(p[5], tuple) and p[5][0] == 'WHERE':
-            p[0] = ('SELECT', p[2], p[4], p[5], None)
-        else:
-            p[0] = ('SELECT', p[2], p[4], None, p[5])
-    else:
-        p[0] = ('SELECT', p[2], p[4], None, None)
+def p_print_table(p):
+    '''print_statement : PRINT TABLE ID SEMICOLON'''
+    """Parse PRINT TABLE table_name;"""
+    p[0] = Print('PRINT', p[3])
+
+def p_print_table_as(p):
+    '''print_statement : PRINT TABLE ID AS STRING SEMICOLON'''
+    """Parse PRINT TABLE table_name AS "title";"""
+    p[0] = PrintAs('PRINT', p[3], p[5])
+
+def p_print_avg(p):
+    '''print_statement : PRINT AVG LPAREN ID RPAREN FROM ID SEMICOLON'''
+    """Parse PRINT AVG(column) FROM table;"""
+    p[0] = PrintAvg('PRINT_AVG', p[4], p[7])
+
+def p_print_string(p):
+    '''print_statement : PRINT STRING SEMICOLON'''
+    """Parse PRINT "message";"""
+    p[0] = PrintString('PRINT_STRING', p[2])
+
+def p_select_where_limit(p):
+    '''select_statement : SELECT distinct_clause select_list FROM ID where_clause limit_clause SEMICOLON'''
+    """Parse SELECT queries with WHERE and LIMIT clauses (DISTINCT is optional)."""
+    p[0] = Select('SELECT', p[3], p[5], p[6], p[7], p[2])
+
+def p_select_where(p):
+    '''select_statement : SELECT distinct_clause select_list FROM ID where_clause SEMICOLON'''
+    """Parse SELECT queries with a WHERE clause."""
+    p[0] = Select('SELECT', p[3], p[5], p[6], None, p[2])
+
+def p_select_limit(p):
+    '''select_statement : SELECT distinct_clause select_list FROM ID limit_clause SEMICOLON'''
+    """Parse SELECT queries with a LIMIT clause."""
+    p[0] = Select('SELECT', p[3], p[5], None, p[6], p[2])
+
+def p_select_all(p):
+    '''select_statement : SELECT distinct_clause select_list FROM ID SEMICOLON'''
+    """Parse SELECT queries without WHERE or LIMIT."""
+    p[0] = Select('SELECT', p[3], p[5], None, None, p[2])
+
+def p_distinct_clause(p):
+    '''distinct_clause : DISTINCT
+                      | empty'''
+    """Parse the optional DISTINCT marker (True when present)."""
+    p[0] = p[1] == 'DISTINCT'
 
 def p_select_list(p):
     '''select_list : STAR
                   | column_list'''
-    """Parse select list (* or list of columns)."""
-    p[0] = '*' if p[1] == '*' else p[1]
+    """Parse select list (* or list of columns); STAR's value is already '*'."""
+    p[0] = p[1]
+
+def p_select_list_count(p):
+    '''select_list : COUNT LPAREN STAR RPAREN'''
+    """Parse COUNT(*) as the select list."""
+    p[0] = 'COUNT'
 
 def p_column_list(p):
     '''column_list : ID
@@ -107,23 +281,29 @@ def p_column_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_where_clause(p):
     '''where_clause : WHERE condition
                    | empty'''
     """Parse WHERE clause or empty."""
-    p[0] = None if len(p) == 2 else ('WHERE', p[2])
+    p[0] = None if len(p) == 2 else Where('WHERE', p[2])
 
 def p_condition(p):
     '''condition : ID comparison_operator value
                 | condition AND condition'''
-    """Parse a condition (e.g., col = value or cond AND cond)."""
+    """Parse a condition (e.g., col = value or cond AND cond).
+
+    Chains of AND are flattened into one And node holding every operand.
+    """
     if len(p) == 4:
         if p[2] == 'AND':
-            p[0] = ('AND', p[1], p[3])
+            conditions = p[1].conditions if isinstance(p[1], And) else [p[1]]
+            conditions.extend(p[3].conditions if isinstance(p[3], And) else [p[3]])
+            p[0] = And('AND', conditions)
         else:
-            p[0] = (p[2], p[1], p[3])
+            p[0] = Comparison(p[2], p[1], p[3])
 
 def p_comparison_operator(p):
     '''comparison_operator : EQUALS
@@ -133,7 +313,7 @@ def p_comparison_operator(p):
                           | LTE
                           | GTE'''
     """Parse comparison operators (=, <>, <, >, <=, >=)."""
-    p[0] = p[1]
+    p[0] = COMPARISON_OPERATORS[p[1]]
 
 def p_value(p):
     '''value : NUMBER
@@ -145,33 +325,35 @@ def p_value(p):
 def p_limit_clause(p):
     '''limit_clause : LIMIT NUMBER
                    | empty'''
-    """Parse LIMIT clause or empty."""
-    p[0] = None if len(p) == 2 else p[2]
+    """Parse LIMIT clause or empty (the limit is stored as an int)."""
+    p[0] = None if len(p) == 2 else int(p[2])
 
 def p_create_table_statement(p):
     '''create_table_statement : CREATE TABLE ID select_statement
                              | CREATE TABLE ID FROM ID JOIN ID USING LPAREN ID RPAREN SEMICOLON'''
     """Parse CREATE TABLE from SELECT or JOIN."""
     if len(p) == 5:
-        p[0] = ('CREATE_FROM_SELECT', p[3], p[4])
+        p[0] = CreateFromSelect('CREATE_FROM_SELECT', p[3], p[4])
     else:
-        p[0] = ('CREATE_FROM_JOIN', p[3], p[5], p[7], p[10])
+        p[0] = CreateFromJoin('CREATE_FROM_JOIN', p[3], p[5], p[7], p[10])
 
 def p_procedure_statement(p):
     '''procedure_statement : PROCEDURE ID DO statement_list END SEMICOLON'''
     """Parse PROCEDURE definition."""
-    procedures[p[2]] = p[4]
-    p[0] = ('PROCEDURE', p[2], p[4])
+    # The body is only iterated, so it is frozen into a tuple
+    statements = tuple(p[4])
+    procedures[p[2]] = statements
+    p[0] = Procedure('PROCEDURE', p[2], statements)
 
 def p_call_statement(p):
     '''call_statement : CALL ID SEMICOLON'''
     """Parse CALL procedure_name;"""
-    p[0] = ('CALL', p[2])
+    p[0] = Call('CALL', p[2])
 
 def p_update_statement(p):
     '''update_statement : UPDATE ID SET ID EQUALS STRING WHERE ID EQUALS STRING SEMICOLON'''
     # Só aceita UPDATE observacoes SET DataHoraObservacao = ... WHERE Id = ...;
-    p[0] = ('UPDATE_DATAHORA', p[2], p[4], p[6], p[8], p[10])
+    p[0] = UpdateDataHora('UPDATE_DATAHORA', p[2], p[4], p[6], p[8], p[10])
 
 def p_empty(p):
     '''empty :'''
@@ -179,11 +361,12 @@ def p_empty(p):
     pass
 
 def p_error(p):
-    """Handle syntax errors."""
+    """Handle syntax errors by aborting the parse with a ParseError."""
     if p:
-        print(f"Syntax error at token {p.type} (value: {p.value}) at line {p.lineno}, position {p.lexpos}")
-    else:
-        print("Syntax error at EOF")
+        raise ParseError(p.type, p.value, p.lineno, p.lexpos)
+    raise ParseError.eof()
 
-# Build the parser
-parser = yacc.yacc()
\ No newline at end of file
+# Build the parser from the LALR tables cached in parsetab.py. optimize=1 loads
+# them without checking the grammar signature, so delete parsetab.py after
+# changing any grammar rule to have the tables regenerated
+parser = yacc.yacc(optimize=1, debug=False, write_tables=True, tabmodule='parsetab')
\ No newline at end of file
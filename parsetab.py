@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftANDAND AS AVG CALL COMMA COMMENT CREATE DISCARD DO END EQUALS EXPORT FROM GT GTE ID IMPORT JOIN LIMIT LPAREN LT LTE MULTILINE_COMMENT NOTEQUALS NUMBER PRINT PROCEDURE RENAME RPAREN SELECT SEMICOLON SET STAR STRING TABLE UPDATE USING WHEREprogram : statement_liststatement_list : statement\n                     | statement_list statementstatement : import_statement\n                | export_statement\n                | discard_statement\n                | rename_statement\n                | print_statement\n                | select_statement\n                | create_table_statement\n                | procedure_statement\n                | call_statement\n                | update_statementimport_statement : IMPORT TABLE ID FROM STRING SEMICOLONexport_statement : EXPORT TABLE ID AS STRING SEMICOLON\n                       | EXPORT AVG LPAREN ID RPAREN FROM ID AS STRING SEMICOLONdiscard_statement : DISCARD TABLE ID SEMICOLONrename_statement : RENAME TABLE ID ID SEMICOLONprint_statement : PRINT TABLE ID SEMICOLON\n                      | PRINT TABLE ID AS STRING SEMICOLON\n                      | PRINT AVG LPAREN ID RPAREN FROM ID SEMICOLON\n                      | PRINT STRING SEMICOLONselect_statement : SELECT select_list FROM ID where_clause limit_clause SEMICOLON\n                       | SELECT select_list FROM ID where_clause SEMICOLON\n                       | SELECT select_list FROM ID limit_clause SEMICOLON\n                       | SELECT select_list FROM ID SEMICOLONselect_list : STAR\n                  | column_listcolumn_list : ID\n                  | column_list COMMA IDwhere_clause : WHERE condition\n                   | emptycondition : ID comparison_operator value\n                | condition AND conditioncomparison_operator : EQUALS\n                          | NOTEQUALS\n                          | LT\n                          | GT\n                          | LTE\n                          | GTEvalue : NUMBER\n            | STRING\n            | IDlimit_clause : LIMIT NUMBER\n                   | emptycreate_table_statement : CREATE TABLE ID select_statement\n                             | CREATE TABLE ID FROM ID JOIN ID USING LPAREN ID RPAREN SEMICOLONprocedure_statement : PROCEDURE ID DO statement_list END SEMICOLONcall_statement : CALL ID SEMICOLONupdate_statement : UPDATE ID SET ID EQUALS STRING WHERE ID EQUALS STRING SEMICOLONempty :'
+_lr_signature = 'leftANDAND AS AVG CALL COMMA COMMENT COUNT CREATE DISCARD DISTINCT DO END EQUALS EXPORT FROM GT GTE ID IMPORT JOIN LIMIT LPAREN LT LTE MULTILINE_COMMENT NOTEQUALS NUMBER PRINT PROCEDURE RENAME RPAREN SELECT SEMICOLON SET STAR STRING TABLE UPDATE USING WHEREprogram : statement_liststatement_list : statement\n                     | statement_list statementstatement : import_statement\n                | export_statement\n                | discard_statement\n                | rename_statement\n                | print_statement\n                | select_statement\n                | create_table_statement\n                | procedure_statement\n                | call_statement\n                | update_statementimport_statement : IMPORT TABLE ID FROM STRING SEMICOLONexport_statement : EXPORT TABLE ID AS STRING SEMICOLON\n                       | EXPORT AVG LPAREN ID RPAREN FROM ID AS STRING SEMICOLONdiscard_statement : DISCARD TABLE ID SEMICOLONrename_statement : RENAME TABLE ID ID SEMICOLONprint_statement : PRINT TABLE ID SEMICOLONprint_statement : PRINT TABLE ID AS STRING SEMICOLONprint_statement : PRINT AVG LPAREN ID RPAREN FROM ID SEMICOLONprint_statement : PRINT STRING SEMICOLONselect_statement : SELECT distinct_clause select_list FROM ID where_clause limit_clause SEMICOLONselect_statement : SELECT distinct_clause select_list FROM ID where_clause SEMICOLONselect_statement : SELECT distinct_clause select_list FROM ID limit_clause SEMICOLONselect_statement : SELECT distinct_clause select_list FROM ID SEMICOLONdistinct_clause : DISTINCT\n                      | emptyselect_list : STAR\n                  | column_listselect_list : COUNT LPAREN STAR RPARENcolumn_list : ID\n                  | column_list COMMA IDwhere_clause : WHERE condition\n                   | emptycondition : ID comparison_operator value\n                | condition AND conditioncomparison_operator : EQUALS\n                          | NOTEQUALS\n                          | LT\n                          | GT\n                          | LTE\n                          | GTEvalue : NUMBER\n            | STRING\n            | IDlimit_clause : LIMIT NUMBER\n                   | emptycreate_table_statement : CREATE TABLE ID select_statement\n                             | CREATE TABLE ID FROM ID JOIN ID USING LPAREN ID RPAREN SEMICOLONprocedure_statement : PROCEDURE ID DO statement_list END SEMICOLONcall_statement : CALL ID SEMICOLONupdate_statement : UPDATE ID SET ID EQUALS STRING WHERE ID EQUALS STRING SEMICOLONempty :'
     
-_lr_action_items = {'IMPORT':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[14,14,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,14,-49,-17,-19,-46,14,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'EXPORT':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[15,15,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,15,-49,-17,-19,-46,15,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'DISCARD':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[16,16,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,16,-49,-17,-19,-46,16,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'RENAME':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[17,17,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,17,-49,-17,-19,-46,17,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[18,18,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,18,-49,-17,-19,-46,18,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'SELECT':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,51,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[19,19,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,19,19,-49,-17,-19,-46,19,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'CREATE':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[20,20,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,20,-49,-17,-19,-46,20,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'PROCEDURE':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[21,21,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,21,-49,-17,-19,-46,21,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'CALL':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[22,22,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,22,-49,-17,-19,-46,22,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'UPDATE':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,47,52,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[23,23,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,23,-49,-17,-19,-46,23,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,24,47,53,58,60,65,72,77,84,85,87,90,92,97,101,113,124,128,129,],[0,-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,-49,-17,-19,-46,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'END':([3,4,5,6,7,8,9,10,11,12,13,24,47,53,58,60,65,67,72,77,84,85,87,90,92,97,101,113,124,128,129,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,-49,-17,-19,-46,82,-18,-26,-14,-15,-20,-24,-25,-48,-23,-21,-16,-50,-47,]),'TABLE':([14,15,16,17,18,20,],[25,26,28,29,30,37,]),'AVG':([15,18,],[27,32,]),'STRING':([18,55,56,61,83,103,104,105,106,107,108,109,112,123,],[31,69,70,73,98,118,-35,-36,-37,-38,-39,-40,121,126,]),'STAR':([19,],[35,]),'ID':([19,21,22,23,25,26,28,29,30,37,43,45,48,49,50,54,66,78,86,88,96,102,103,104,105,106,107,108,109,111,122,],[34,38,39,40,41,42,44,45,46,51,57,59,62,63,64,68,81,94,99,100,110,94,115,-35,-36,-37,-38,-39,-40,120,125,]),'LPAREN':([27,32,119,],[43,48,122,]),'SEMICOLON':([31,39,44,46,59,63,69,70,73,75,76,79,82,89,91,93,95,100,114,115,116,117,118,121,126,127,],[47,53,58,60,72,77,84,85,87,90,92,-32,97,101,-45,-31,-44,113,-34,-43,-33,-41,-42,124,128,129,]),'FROM':([33,34,35,36,41,51,64,71,74,],[49,-29,-27,-28,55,66,-30,86,88,]),'COMMA':([34,36,64,],[-29,50,-30,]),'DO':([38,],[52,]),'SET':([40,],[54,]),'AS':([42,46,99,],[56,61,112,]),'RPAREN':([57,62,125,],[71,74,127,]),'WHERE':([63,98,],[78,111,]),'LIMIT':([63,75,79,93,114,115,116,117,118,],[80,80,-32,-31,-34,-43,-33,-41,-42,]),'EQUALS':([68,94,120,],[83,104,123,]),'NUMBER':([80,103,104,105,106,107,108,109,],[95,117,-35,-36,-37,-38,-39,-40,]),'JOIN':([81,],[96,]),'AND':([93,114,115,116,117,118,],[102,-34,-43,-33,-41,-42,]),'NOTEQUALS':([94,],[105,]),'LT':([94,],[106,]),'GT':([94,],[107,]),'LTE':([94,],[108,]),'GTE':([94,],[109,]),'USING':([110,],[119,]),}
+_lr_action_items = {'IMPORT':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[14,14,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,14,-52,-17,-19,-49,14,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'EXPORT':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[15,15,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,15,-52,-17,-19,-49,15,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'DISCARD':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[16,16,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,16,-52,-17,-19,-49,16,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'RENAME':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[17,17,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,17,-52,-17,-19,-49,17,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[18,18,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,18,-52,-17,-19,-49,18,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'SELECT':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,53,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[19,19,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,19,19,-52,-17,-19,-49,19,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'CREATE':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[20,20,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,20,-52,-17,-19,-49,20,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'PROCEDURE':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[21,21,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,21,-52,-17,-19,-49,21,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'CALL':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[22,22,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,22,-52,-17,-19,-49,22,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'UPDATE':([0,2,3,4,5,6,7,8,9,10,11,12,13,24,46,54,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[23,23,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,23,-52,-17,-19,-49,23,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,24,46,55,60,62,68,75,84,85,87,91,97,102,104,111,112,131,135,136,],[0,-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,-52,-17,-19,-49,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'END':([3,4,5,6,7,8,9,10,11,12,13,24,46,55,60,62,68,70,75,84,85,87,91,97,102,104,111,112,131,135,136,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-3,-22,-52,-17,-19,-49,82,-18,-14,-15,-20,-26,-51,-24,-25,-21,-23,-16,-53,-50,]),'TABLE':([14,15,16,17,18,20,],[25,26,28,29,30,36,]),'AVG':([15,18,],[27,32,]),'STRING':([18,57,58,63,83,110,114,115,116,117,118,119,120,130,],[31,72,73,76,98,123,128,-38,-39,-40,-41,-42,-43,133,]),'DISTINCT':([19,],[34,]),'STAR':([19,33,34,35,67,],[-54,50,-27,-28,80,]),'COUNT':([19,33,34,35,],[-54,52,-27,-28,]),'ID':([19,21,22,23,25,26,28,29,30,33,34,35,36,42,44,47,56,65,66,69,86,88,92,96,109,113,114,115,116,117,118,119,120,129,],[-54,37,38,39,40,41,43,44,45,49,-27,-28,53,59,61,64,71,78,79,81,99,100,106,108,122,106,125,-38,-39,-40,-41,-42,-43,132,]),'LPAREN':([27,32,52,121,],[42,47,67,129,]),'SEMICOLON':([31,38,43,45,61,72,73,76,78,82,89,90,93,100,101,103,105,107,123,124,125,126,127,128,133,134,],[46,55,60,62,75,84,85,87,91,97,102,104,-35,111,112,-48,-34,-47,131,-37,-46,-36,-44,-45,135,136,]),'DO':([37,],[54,]),'SET':([39,],[56,]),'FROM':([40,48,49,50,51,53,74,77,79,95,],[57,65,-32,-29,-30,69,86,88,-33,-31,]),'AS':([41,45,99,],[58,63,110,]),'COMMA':([49,51,79,],[-32,66,-33,]),'RPAREN':([59,64,80,132,],[74,77,95,134,]),'EQUALS':([71,106,122,],[83,115,130,]),'WHERE':([78,98,],[92,109,]),'LIMIT':([78,89,93,105,124,125,126,127,128,],[94,94,-35,-34,-37,-46,-36,-44,-45,]),'JOIN':([81,],[96,]),'NUMBER':([94,114,115,116,117,118,119,120,],[107,127,-38,-39,-40,-41,-42,-43,]),'AND':([105,124,125,126,127,128,],[113,-37,-46,-36,-44,-45,]),'NOTEQUALS':([106,],[116,]),'LT':([106,],[117,]),'GT':([106,],[118,]),'LTE':([106,],[119,]),'GTE':([106,],[120,]),'USING':([108,],[121,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,52,],[2,67,]),'statement':([0,2,52,67,],[3,24,3,24,]),'import_statement':([0,2,52,67,],[4,4,4,4,]),'export_statement':([0,2,52,67,],[5,5,5,5,]),'discard_statement':([0,2,52,67,],[6,6,6,6,]),'rename_statement':([0,2,52,67,],[7,7,7,7,]),'print_statement':([0,2,52,67,],[8,8,8,8,]),'select_statement':([0,2,51,52,67,],[9,9,65,9,9,]),'create_table_statement':([0,2,52,67,],[10,10,10,10,]),'procedure_statement':([0,2,52,67,],[11,11,11,11,]),'call_statement':([0,2,52,67,],[12,12,12,12,]),'update_statement':([0,2,52,67,],[13,13,13,13,]),'select_list':([19,],[33,]),'column_list':([19,],[36,]),'where_clause':([63,],[75,]),'limit_clause':([63,75,],[76,89,]),'empty':([63,75,],[79,91,]),'condition':([78,102,],[93,114,]),'comparison_operator':([94,],[103,]),'value':([103,],[116,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,54,],[2,70,]),'statement':([0,2,54,70,],[3,24,3,24,]),'import_statement':([0,2,54,70,],[4,4,4,4,]),'export_statement':([0,2,54,70,],[5,5,5,5,]),'discard_statement':([0,2,54,70,],[6,6,6,6,]),'rename_statement':([0,2,54,70,],[7,7,7,7,]),'print_statement':([0,2,54,70,],[8,8,8,8,]),'select_statement':([0,2,53,54,70,],[9,9,68,9,9,]),'create_table_statement':([0,2,54,70,],[10,10,10,10,]),'procedure_statement':([0,2,54,70,],[11,11,11,11,]),'call_statement':([0,2,54,70,],[12,12,12,12,]),'update_statement':([0,2,54,70,],[13,13,13,13,]),'distinct_clause':([19,],[33,]),'empty':([19,78,89,],[35,93,103,]),'select_list':([33,],[48,]),'column_list':([33,],[51,]),'where_clause':([78,],[89,]),'limit_clause':([78,89,],[90,101,]),'condition':([92,113,],[105,124,]),'comparison_operator':([106,],[114,]),'value':([114,],[126,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,55 +27,58 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','parser.py',16),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',21),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',22),
-  ('statement -> import_statement','statement',1,'p_statement','parser.py',30),
-  ('statement -> export_statement','statement',1,'p_statement','parser.py',31),
-  ('statement -> discard_statement','statement',1,'p_statement','parser.py',32),
-  ('statement -> rename_statement','statement',1,'p_statement','parser.py',33),
-  ('statement -> print_statement','statement',1,'p_statement','parser.py',34),
-  ('statement -> select_statement','statement',1,'p_statement','parser.py',35),
-  ('statement -> create_table_statement','statement',1,'p_statement','parser.py',36),
-  ('statement -> procedure_statement','statement',1,'p_statement','parser.py',37),
-  ('statement -> call_statement','statement',1,'p_statement','parser.py',38),
-  ('statement -> update_statement','statement',1,'p_statement','parser.py',39),
-  ('import_statement -> IMPORT TABLE ID FROM STRING SEMICOLON','import_statement',6,'p_import_statement','parser.py',44),
-  ('export_statement -> EXPORT TABLE ID AS STRING SEMICOLON','export_statement',6,'p_export_statement','parser.py',49),
-  ('export_statement -> EXPORT AVG LPAREN ID RPAREN FROM ID AS STRING SEMICOLON','export_statement',10,'p_export_statement','parser.py',50),
-  ('discard_statement -> DISCARD TABLE ID SEMICOLON','discard_statement',4,'p_discard_statement','parser.py',58),
-  ('rename_statement -> RENAME TABLE ID ID SEMICOLON','rename_statement',5,'p_rename_statement','parser.py',63),
-  ('print_statement -> PRINT TABLE ID SEMICOLON','print_statement',4,'p_print_statement','parser.py',68),
-  ('print_statement -> PRINT TABLE ID AS STRING SEMICOLON','print_statement',6,'p_print_statement','parser.py',69),
-  ('print_statement -> PRINT AVG LPAREN ID RPAREN FROM ID SEMICOLON','print_statement',8,'p_print_statement','parser.py',70),
-  ('print_statement -> PRINT STRING SEMICOLON','print_statement',3,'p_print_statement','parser.py',71),
-  ('select_statement -> SELECT select_list FROM ID where_clause limit_clause SEMICOLON','select_statement',7,'p_select_statement','parser.py',82),
-  ('select_statement -> SELECT select_list FROM ID where_clause SEMICOLON','select_statement',6,'p_select_statement','parser.py',83),
-  ('select_statement -> SELECT select_list FROM ID limit_clause SEMICOLON','select_statement',6,'p_select_statement','parser.py',84),
-  ('select_statement -> SELECT select_list FROM ID SEMICOLON','select_statement',5,'p_select_statement','parser.py',85),
-  ('select_list -> STAR','select_list',1,'p_select_list','parser.py',98),
-  ('select_list -> column_list','select_list',1,'p_select_list','parser.py',99),
-  ('column_list -> ID','column_list',1,'p_column_list','parser.py',104),
-  ('column_list -> column_list COMMA ID','column_list',3,'p_column_list','parser.py',105),
-  ('where_clause -> WHERE condition','where_clause',2,'p_where_clause','parser.py',113),
-  ('where_clause -> empty','where_clause',1,'p_where_clause','parser.py',114),
-  ('condition -> ID comparison_operator value','condition',3,'p_condition','parser.py',119),
-  ('condition -> condition AND condition','condition',3,'p_condition','parser.py',120),
-  ('comparison_operator -> EQUALS','comparison_operator',1,'p_comparison_operator','parser.py',129),
-  ('comparison_operator -> NOTEQUALS','comparison_operator',1,'p_comparison_operator','parser.py',130),
-  ('comparison_operator -> LT','comparison_operator',1,'p_comparison_operator','parser.py',131),
-  ('comparison_operator -> GT','comparison_operator',1,'p_comparison_operator','parser.py',132),
-  ('comparison_operator -> LTE','comparison_operator',1,'p_comparison_operator','parser.py',133),
-  ('comparison_operator -> GTE','comparison_operator',1,'p_comparison_operator','parser.py',134),
-  ('value -> NUMBER','value',1,'p_value','parser.py',139),
-  ('value -> STRING','value',1,'p_value','parser.py',140),
-  ('value -> ID','value',1,'p_value','parser.py',141),
-  ('limit_clause -> LIMIT NUMBER','limit_clause',2,'p_limit_clause','parser.py',146),
-  ('limit_clause -> empty','limit_clause',1,'p_limit_clause','parser.py',147),
-  ('create_table_statement -> CREATE TABLE ID select_statement','create_table_statement',4,'p_create_table_statement','parser.py',152),
-  ('create_table_statement -> CREATE TABLE ID FROM ID JOIN ID USING LPAREN ID RPAREN SEMICOLON','create_table_statement',12,'p_create_table_statement','parser.py',153),
-  ('procedure_statement -> PROCEDURE ID DO statement_list END SEMICOLON','procedure_statement',6,'p_procedure_statement','parser.py',161),
-  ('call_statement -> CALL ID SEMICOLON','call_statement',3,'p_call_statement','parser.py',167),
-  ('update_statement -> UPDATE ID SET ID EQUALS STRING WHERE ID EQUALS STRING SEMICOLON','update_statement',11,'p_update_statement','parser.py',172),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',177),
+  ('program -> statement_list','program',1,'p_program','parser.py',168),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',173),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',174),
+  ('statement -> import_statement','statement',1,'p_statement','parser.py',183),
+  ('statement -> export_statement','statement',1,'p_statement','parser.py',184),
+  ('statement -> discard_statement','statement',1,'p_statement','parser.py',185),
+  ('statement -> rename_statement','statement',1,'p_statement','parser.py',186),
+  ('statement -> print_statement','statement',1,'p_statement','parser.py',187),
+  ('statement -> select_statement','statement',1,'p_statement','parser.py',188),
+  ('statement -> create_table_statement','statement',1,'p_statement','parser.py',189),
+  ('statement -> procedure_statement','statement',1,'p_statement','parser.py',190),
+  ('statement -> call_statement','statement',1,'p_statement','parser.py',191),
+  ('statement -> update_statement','statement',1,'p_statement','parser.py',192),
+  ('import_statement -> IMPORT TABLE ID FROM STRING SEMICOLON','import_statement',6,'p_import_statement','parser.py',197),
+  ('export_statement -> EXPORT TABLE ID AS STRING SEMICOLON','export_statement',6,'p_export_statement','parser.py',202),
+  ('export_statement -> EXPORT AVG LPAREN ID RPAREN FROM ID AS STRING SEMICOLON','export_statement',10,'p_export_statement','parser.py',203),
+  ('discard_statement -> DISCARD TABLE ID SEMICOLON','discard_statement',4,'p_discard_statement','parser.py',211),
+  ('rename_statement -> RENAME TABLE ID ID SEMICOLON','rename_statement',5,'p_rename_statement','parser.py',216),
+  ('print_statement -> PRINT TABLE ID SEMICOLON','print_statement',4,'p_print_table','parser.py',221),
+  ('print_statement -> PRINT TABLE ID AS STRING SEMICOLON','print_statement',6,'p_print_table_as','parser.py',226),
+  ('print_statement -> PRINT AVG LPAREN ID RPAREN FROM ID SEMICOLON','print_statement',8,'p_print_avg','parser.py',231),
+  ('print_statement -> PRINT STRING SEMICOLON','print_statement',3,'p_print_string','parser.py',236),
+  ('select_statement -> SELECT distinct_clause select_list FROM ID where_clause limit_clause SEMICOLON','select_statement',8,'p_select_where_limit','parser.py',241),
+  ('select_statement -> SELECT distinct_clause select_list FROM ID where_clause SEMICOLON','select_statement',7,'p_select_where','parser.py',246),
+  ('select_statement -> SELECT distinct_clause select_list FROM ID limit_clause SEMICOLON','select_statement',7,'p_select_limit','parser.py',251),
+  ('select_statement -> SELECT distinct_clause select_list FROM ID SEMICOLON','select_statement',6,'p_select_all','parser.py',256),
+  ('distinct_clause -> DISTINCT','distinct_clause',1,'p_distinct_clause','parser.py',261),
+  ('distinct_clause -> empty','distinct_clause',1,'p_distinct_clause','parser.py',262),
+  ('select_list -> STAR','select_list',1,'p_select_list','parser.py',267),
+  ('select_list -> column_list','select_list',1,'p_select_list','parser.py',268),
+  ('select_list -> COUNT LPAREN STAR RPAREN','select_list',4,'p_select_list_count','parser.py',273),
+  ('column_list -> ID','column_list',1,'p_column_list','parser.py',278),
+  ('column_list -> column_list COMMA ID','column_list',3,'p_column_list','parser.py',279),
+  ('where_clause -> WHERE condition','where_clause',2,'p_where_clause','parser.py',288),
+  ('where_clause -> empty','where_clause',1,'p_where_clause','parser.py',289),
+  ('condition -> ID comparison_operator value','condition',3,'p_condition','parser.py',294),
+  ('condition -> condition AND condition','condition',3,'p_condition','parser.py',295),
+  ('comparison_operator -> EQUALS','comparison_operator',1,'p_comparison_operator','parser.py',309),
+  ('comparison_operator -> NOTEQUALS','comparison_operator',1,'p_comparison_operator','parser.py',310),
+  ('comparison_operator -> LT','comparison_operator',1,'p_comparison_operator','parser.py',311),
+  ('comparison_operator -> GT','comparison_operator',1,'p_comparison_operator','parser.py',312),
+  ('comparison_operator -> LTE','comparison_operator',1,'p_comparison_operator','parser.py',313),
+  ('comparison_operator -> GTE','comparison_operator',1,'p_comparison_operator','parser.py',314),
+  ('value -> NUMBER','value',1,'p_value','parser.py',319),
+  ('value -> STRING','value',1,'p_value','parser.py',320),
+  ('value -> ID','value',1,'p_value','parser.py',321),
+  ('limit_clause -> LIMIT NUMBER','limit_clause',2,'p_limit_clause','parser.py',326),
+  ('limit_clause -> empty','limit_clause',1,'p_limit_clause','parser.py',327),
+  ('create_table_statement -> CREATE TABLE ID select_statement','create_table_statement',4,'p_create_table_statement','parser.py',332),
+  ('create_table_statement -> CREATE TABLE ID FROM ID JOIN ID USING LPAREN ID RPAREN SEMICOLON','create_table_statement',12,'p_create_table_statement','parser.py',333),
+  ('procedure_statement -> PROCEDURE ID DO statement_list END SEMICOLON','procedure_statement',6,'p_procedure_statement','parser.py',341),
+  ('call_statement -> CALL ID SEMICOLON','call_statement',3,'p_call_statement','parser.py',349),
+  ('update_statement -> UPDATE ID SET ID EQUALS STRING WHERE ID EQUALS STRING SEMICOLON','update_statement',11,'p_update_statement','parser.py',354),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',359),
 ]